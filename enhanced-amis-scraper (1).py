@@ -2,18 +2,174 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+import requests
+import urllib3
+import argparse
+import lxml.html
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
+import multiprocessing.util
+import functools
+import itertools
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import atexit
+import signal
+import subprocess
+import threading
 import time
+import weakref
+import io
 import logging
 import json
 import os
+import queue
 import re
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Iterator, List, Tuple
+
+try:
+    import psutil
+except ImportError:  # Only needed to reap Chrome processes chromedriver leaves behind
+    psutil = None
+
+# Matches the DataTables summary, e.g. "Showing 1 to 10 of 250 entries"
+_ENTRIES_RE = re.compile(r'of (\d+) entries')
+
+# Low-cardinality text columns of the results table
+_CATEGORY_COLUMNS = ['Market', 'Commodity', 'Classification', 'Grade', 'Sex', 'County']
+
+
+def _apply_column_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert repeated text columns to category, prices to numbers and parse the Date column."""
+    df = df.astype({col: 'category' for col in _CATEGORY_COLUMNS if col in df.columns})
+    for col in df.columns:
+        # Prices with thousands separators or placeholders come back as text
+        if 'Price' in str(col) and df[col].dtype == object:
+            df[col] = pd.to_numeric(df[col].str.replace(',', '', regex=False), errors='coerce')
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d', errors='coerce', cache=True)
+    return df
+
+
+def _merge_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """
+    Union of the given schemas' columns, in first-seen order.
+    
+    Categories are decoded to their value type, since each part has its own dictionary.
+    A column whose inferred type differs between parts is widened: mixed integer and
+    float columns become float64, and any other mix becomes string.
+    """
+    seen: Dict[str, set] = {}
+    for schema in schemas:
+        for field in schema:
+            value_type = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+            types = seen.setdefault(field.name, set())
+            if not pa.types.is_null(value_type):  # All-null parts take any type
+                types.add(value_type)
+    fields = []
+    for name, types in seen.items():
+        if not types:
+            field_type = pa.null()
+        elif len(types) == 1:
+            field_type = next(iter(types))
+        elif all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+            field_type = pa.float64()
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(name, field_type))
+    return pa.schema(fields)
+
+
+# Scrapers whose browsers are still open; weak so registering doesn't keep them alive
+_live_scrapers = weakref.WeakSet()
+
+
+def _shutdown_all():
+    """Quit the browser of every scraper still alive in this process."""
+    for scraper in list(_live_scrapers):
+        scraper._hard_shutdown()
+
+
+def _handle_sigterm(signum, frame):
+    """Clean up every browser before exiting on SIGTERM."""
+    _shutdown_all()
+    raise SystemExit(128 + signum)
+
+
+# Make sure Chrome goes away when the interpreter exits
+atexit.register(_shutdown_all)
+
+
+def _read_results_table(html: str) -> Optional[pd.DataFrame]:
+    """Parse the first table whose class list includes table-bordered, or None if there is none."""
+    tables = lxml.html.fromstring(html).xpath(
+        "//table[contains(concat(' ', normalize-space(@class), ' '), ' table-bordered ')]"
+    )
+    if not tables:
+        return None
+    return pd.read_html(
+        io.StringIO(lxml.html.tostring(tables[0], encoding='unicode')), flavor='lxml'
+    )[0]
+
+
+class _TokenBucket:
+    """
+    Adaptive rate limiter: backs off when the server pushes back, speeds up when it doesn't.
+    
+    Safe to share between threads.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0,
+                 max_rate: float = 2.0, min_rate: float = 0.05,
+                 grow_after: int = 50):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.grow_after = grow_after
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def record_success(self):
+        """Raise the rate by 10% after a run of consecutive successes."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.grow_after:
+                self._successes = 0
+                self.rate = min(self.max_rate, self.rate * 1.1)
+
+    def record_failure(self):
+        """Halve the rate after a throttled or failed request."""
+        with self._lock:
+            self._successes = 0
+            self.rate = max(self.min_rate, self.rate / 2)
 
 class AMISScraper:
     """Enhanced Agricultural Market Information System (AMIS) scraper with improved reliability."""
@@ -28,11 +184,35 @@ class AMISScraper:
     
     MAX_RETRIES = 3
     BATCH_SIZE = 1000  # Number of rows to process at once for memory efficiency
+    DRIVER_RECYCLE_EVERY = 200  # Restart Chrome after this many scrapes to bound its memory growth
+    
+    # Resolved chromedriver path, shared by every driver this process starts
+    _driver_path: Optional[str] = None
+    _driver_path_lock = threading.Lock()
+    COMMAND_POOL_SIZE = 20  # Keep-alive connections to chromedriver
+    PROGRESS_SNAPSHOT_EVERY = 500  # Compact the progress log after this many entries
+    
+    # Elements that show the search page is usable: the filter form or the results summary
+    PAGE_READY_SELECTOR = "select[name='county[]'], .dataTables_info"
+    SUBMIT_LOCATOR = (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']")
+    
+    # Requests the results table never needs
+    BLOCKED_URL_PATTERNS = [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+        "*.woff", "*.woff2", "*.ttf",
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg"
+    ]
     
     def __init__(self, 
                  url: str = "https://amis.co.ke/site/market_search/market_search",
                  headless: bool = True,
-                 timeout: int = 40):
+                 timeout: int = 40,
+                 remote_url: Optional[str] = None,
+                 log_level: int = logging.INFO):
         """
         Initialize the enhanced AMIS scraper.
         
@@ -40,9 +220,18 @@ class AMISScraper:
             url (str): Base URL for scraping
             headless (bool): Whether to run Chrome in headless mode
             timeout (int): Maximum wait time for page elements
+            remote_url (str): Selenium server to run Chrome on instead of a local
+                chromedriver, e.g. a container started with
+                ``docker run --rm -p 4444:4444 --shm-size=2g
+                --tmpfs /home/seluser/.config/google-chrome:rw,size=512m
+                -e SE_DRAIN_AFTER_SESSION_COUNT=200 selenium/standalone-chrome``
+                and restarted by its supervisor whenever it drains
+            log_level (int): Logging level, e.g. logging.WARNING to skip per-scrape messages
         """
         self.url = url
         self.timeout = timeout
+        self.headless = headless
+        self.remote_url = remote_url
         self.entry_options = [10, 50, 100, 1000, 1500, 3000]
         
         # Set up directories
@@ -55,35 +244,63 @@ class AMISScraper:
         self._setup_directories()
         
         # Initialize logger
-        self.logger = self._setup_logger()
+        self.logger = self._setup_logger(log_level)
         
         # Initialize webdriver with enhanced options
+        self._driver_process = None
         self.driver = self._initialize_webdriver(headless)
         self.wait = WebDriverWait(self.driver, timeout)
+        self._ops_since_restart = 0
+        _live_scrapers.add(self)
         
         # Load or initialize progress tracking
         self.progress_file = os.path.join(self.dirs['progress'], 'scraping_progress.json')
+        self.progress_log = os.path.join(self.dirs['progress'], 'scraping_progress.jsonl')
         self.progress = self._load_progress()
+        self._log_entries = 0
+        self._completed = {
+            (c['county'], c['market'], c['product']) for c in self.progress['completed']
+        }
+        
+        # HTTP session for replaying the search form without the browser
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.COMMAND_POOL_SIZE,
+            pool_maxsize=self.COMMAND_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
+        self._bucket = _TokenBucket(rate=1 / self.DELAYS['between_requests'])
+        self._search_form = None
+        
+        # Serialises re-fetching the form after the session expires; the generation
+        # tells a thread whether another one already refreshed it
+        self._form_lock = threading.Lock()
+        self._form_generation = 0
+        
+        # Dropdown option values by select name, keyed by lower-cased visible text
+        self._option_cache: Dict[str, Dict[str, str]] = {}
 
     def _setup_directories(self):
         """Create necessary directories if they don't exist."""
         for directory in self.dirs.values():
             os.makedirs(directory, exist_ok=True)
 
-    def _setup_logger(self) -> logging.Logger:
+    def _setup_logger(self, level: int = logging.INFO) -> logging.Logger:
         """Configure enhanced logging with file and console output."""
         logger = logging.getLogger('AMISScraper')
-        logger.setLevel(logging.INFO)
+        logger.setLevel(level)
         
         # File handler
         fh = logging.FileHandler(
             os.path.join(self.dirs['logs'], f'scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
         )
-        fh.setLevel(logging.INFO)
+        fh.setLevel(level)
         
         # Console handler
         ch = logging.StreamHandler()
-        ch.setLevel(logging.INFO)
+        ch.setLevel(level)
         
         # Formatter
         formatter = logging.Formatter(
@@ -97,11 +314,11 @@ class AMISScraper:
         
         return logger
 
-    def _initialize_webdriver(self, headless: bool) -> webdriver.Chrome:
-        """Initialize Chrome WebDriver with enhanced options."""
+    def _initialize_webdriver(self, headless: bool) -> webdriver.Remote:
+        """Initialize a local or remote Chrome WebDriver with enhanced options."""
         chrome_options = Options()
         if headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
         
         # Performance and stability options
         chrome_options.add_argument("--disable-gpu")
@@ -112,49 +329,136 @@ class AMISScraper:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--disable-notifications")
         chrome_options.add_argument("--ignore-certificate-errors")
+        chrome_options.add_argument("--disable-features=Translate,BackForwardCache")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
         
         # Memory management options
         chrome_options.add_argument("--memory-pressure-off")
         chrome_options.add_argument("--disk-cache-size=1")
         
-        return webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
-        )
+        # Images, stylesheets, fonts and media are never scraped, so don't download them
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        
+        # Return from driver.get() immediately; callers wait for the elements they need
+        chrome_options.page_load_strategy = "none"
+        
+        if self.remote_url:
+            # Chrome runs in a disposable container; quitting the session frees its memory
+            driver = webdriver.Remote(
+                command_executor=self.remote_url,
+                options=chrome_options,
+                keep_alive=True
+            )
+        else:
+            # Threads starting scrapers at once must not all run the install
+            with AMISScraper._driver_path_lock:
+                if AMISScraper._driver_path is None:
+                    AMISScraper._driver_path = ChromeDriverManager().install()
+            
+            driver = webdriver.Chrome(
+                service=Service(AMISScraper._driver_path, log_output=subprocess.DEVNULL),
+                options=chrome_options,
+                keep_alive=True
+            )
+            if psutil is not None:
+                # Remembers the start time too, so a later reuse of the pid is detected
+                self._driver_process = psutil.Process(driver.service.process.pid)
+        driver.set_page_load_timeout(self.timeout)
+        self._enlarge_command_pool(driver)
+        self._block_unneeded_requests(driver)
+        return driver
+
+    def _block_unneeded_requests(self, driver: webdriver.Remote):
+        """Block analytics, fonts and images at the network layer via CDP."""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+        except (WebDriverException, AttributeError) as e:  # Remote drivers lack execute_cdp_cmd
+            self.logger.debug(f"Could not set blocked URLs: {str(e)}")
+
+    def _enlarge_command_pool(self, driver: webdriver.Remote):
+        """Replace the single-connection chromedriver pool with a larger keep-alive pool."""
+        try:
+            executor = driver.command_executor
+            pool_kwargs = dict(getattr(executor._conn, 'connection_pool_kw', {}))
+            pool_kwargs.update(maxsize=self.COMMAND_POOL_SIZE, block=False)
+            executor._conn = urllib3.PoolManager(**pool_kwargs)
+        except AttributeError as e:
+            self.logger.debug(f"Could not resize WebDriver connection pool: {str(e)}")
 
     def _load_progress(self) -> Dict:
-        """Load or initialize progress tracking."""
-        if os.path.exists(self.progress_file):
-            try:
-                with open(self.progress_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                self.logger.warning("Could not load progress file, starting fresh")
-        return {
+        """Load the progress snapshot and replay the append-only log on top of it."""
+        progress = {
             'last_county': None,
             'last_market': None,
             'last_product': None,
             'completed': [],
             'timestamp': None
         }
+        if os.path.exists(self.progress_file):
+            try:
+                with open(self.progress_file, 'r') as f:
+                    progress = json.load(f)
+            except json.JSONDecodeError:
+                self.logger.warning("Could not load progress file, starting fresh")
+        
+        if os.path.exists(self.progress_log):
+            with open(self.progress_log, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Partially written last line
+                    progress.update({
+                        'last_county': entry['county'],
+                        'last_market': entry['market'],
+                        'last_product': entry['product'],
+                        'timestamp': entry['timestamp']
+                    })
+                    progress['completed'].append(entry)
+        return progress
 
     def _save_progress(self, county: str, market: str, product: str):
-        """Save current scraping progress."""
-        self.progress.update({
-            'last_county': county,
-            'last_market': market,
-            'last_product': product,
-            'timestamp': datetime.now().isoformat()
-        })
-        self.progress['completed'].append({
+        """Append one completed combination to the progress log."""
+        entry = {
             'county': county,
             'market': market,
             'product': product,
             'timestamp': datetime.now().isoformat()
+        }
+        self.progress.update({
+            'last_county': county,
+            'last_market': market,
+            'last_product': product,
+            'timestamp': entry['timestamp']
         })
+        self.progress['completed'].append(entry)
+        self._completed.add((county, market, product))
+        
+        with open(self.progress_log, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
         
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+        self._log_entries += 1
+        if self._log_entries >= self.PROGRESS_SNAPSHOT_EVERY:
+            self._write_progress_snapshot()
+
+    def _write_progress_snapshot(self):
+        """Write a compact progress snapshot and truncate the log it replaces."""
+        tmp_file = self.progress_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(self.progress, f, separators=(',', ':'))
+        os.replace(tmp_file, self.progress_file)
+        open(self.progress_log, 'w').close()
+        self._log_entries = 0
 
     def _get_total_entries(self) -> Optional[int]:
         """Get total number of entries available from the page."""
@@ -162,7 +466,7 @@ class AMISScraper:
             info_text = self.wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".dataTables_info"))
             ).text
-            match = re.search(r'of (\d+) entries', info_text)
+            match = _ENTRIES_RE.search(info_text)
             if match:
                 return int(match.group(1))
             return None
@@ -174,11 +478,12 @@ class AMISScraper:
         """Choose optimal entries per page based on total available."""
         if not total_entries:
             return self.entry_options[0]
-            
-        for entry_option in reversed(self.entry_options):
-            if entry_option <= total_entries:
+        
+        # Smallest page size that shows everything on one page; scrape_table reads one page only
+        for entry_option in self.entry_options:
+            if entry_option >= total_entries:
                 return entry_option
-        return self.entry_options[0]
+        return self.entry_options[-1]
 
     def _verify_data_completeness(self, df: pd.DataFrame, expected_count: int) -> bool:
         """Verify scraped data matches expected count."""
@@ -195,254 +500,983 @@ class AMISScraper:
             
         return True
 
+    def _wait_for_page_load(self):
+        """Wait for the DOM to be parsed and the search form to exist, not for every subresource."""
+        self.wait.until(
+            lambda d: d.execute_script("return document.readyState") in ('interactive', 'complete')
+        )
+        self.wait.until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.PAGE_READY_SELECTOR))
+        )
+
     def _refresh_session(self):
-        """Refresh browser session if needed."""
+        """Reload the search page in the existing browser session."""
         try:
-            self.driver.delete_all_cookies()
-            self.driver.refresh()
-            time.sleep(self.DELAYS['after_page_load'])
+            self.driver.get(self.url)
             self._wait_for_page_load()
         except Exception as e:
             self.logger.error(f"Error refreshing session: {str(e)}")
             self._reinitialize_driver()
 
-    def _reinitialize_driver(self):
-        """Reinitialize the WebDriver if it becomes unresponsive."""
+    def _hard_shutdown(self):
+        """Quit the browser and kill any chromedriver/Chrome processes that survive it."""
+        survivors = []
+        proc = self._driver_process
+        if proc is not None:
+            try:
+                if proc.is_running():  # False once the pid belongs to another process
+                    survivors = proc.children(recursive=True) + [proc]
+            except psutil.Error:
+                pass
+        self._driver_process = None
+        
         try:
             self.driver.quit()
-        except:
+        except Exception:
             pass
+        
+        for proc in survivors:
+            try:
+                if proc.is_running():
+                    self.logger.warning(f"Killing orphaned process {proc.pid} ({proc.name()})")
+                    proc.kill()
+            except psutil.Error:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Quit the one long-lived browser when the scraper goes out of scope."""
+        self._hard_shutdown()
+        self.logger.info("Browser closed successfully")
+        return False
+
+    def _reinitialize_driver(self):
+        """Reinitialize the WebDriver if it becomes unresponsive."""
+        try:
+            # Also forgets the old chromedriver, so its pid is never killed later
+            self._hard_shutdown()
         finally:
-            self.driver = self._initialize_webdriver(True)  # Reinitialize in headless mode
+            self.driver = self._initialize_webdriver(self.headless)
             self.wait = WebDriverWait(self.driver, self.timeout)
+            self._ops_since_restart = 0
+
+    def _is_completed(self, county: str, market: str, product: str) -> bool:
+        """Check whether a combination was already scraped in a previous run."""
+        return (county, market, product) in self._completed
+
+    def _scrape_combination(self, county: str, market: str, product: str,
+                            start_date: str, end_date: str,
+                            try_http: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Scrape a single county/market/product combination with retries.
+        
+        try_http=False goes straight to the browser, for callers whose HTTP search already failed.
+        """
+        retry_count = 0
+        while retry_count < self.MAX_RETRIES:
+            self._bucket.acquire()
+            try:
+                self.logger.info(
+                    f"Scraping: County={county}, Market={market}, "
+                    f"Product={product}, Attempt={retry_count + 1}"
+                )
+                
+                # Fast path: replay the search form over HTTP
+                df = self._fetch_table_http(county, market, product,
+                                            start_date, end_date) if try_http else None
+                total_entries = len(df) if df is not None else None
+                
+                if df is None:
+                    # Set filters and get total entries
+                    if not self.set_filters(county, market, product, 
+                                          start_date, end_date, "100"):
+                        raise Exception("Failed to set filters")
+                
+                    total_entries = self._get_total_entries()
+                    if not total_entries:
+                        self.logger.warning("No entries found, skipping...")
+                        return None
+                
+                    # Optimize entries per page
+                    optimal_entries = self._optimize_entries(total_entries)
+                
+                    # Reset filters with optimal entries
+                    if not self.set_filters(county, market, product,
+                                          start_date, end_date, 
+                                          str(optimal_entries)):
+                        raise Exception("Failed to set optimized filters")
+                
+                    # Scrape data
+                    df = self.scrape_table()
+                    
+                    # Learn option values the browser just loaded
+                    self._discover_search_form()
+                
+                # Verify data completeness
+                if self._verify_data_completeness(df, total_entries):
+                    self._bucket.record_success()
+                    return self._add_metadata(df, county, market, product)
+                
+                self._bucket.record_failure()
+                retry_count += 1
+                time.sleep(self.DELAYS['between_retries'])
+                self._refresh_session()
+                
+            except Exception as e:
+                self.logger.error(
+                    f"Error scraping {county}/{market}/{product}: {str(e)}"
+                )
+                self._bucket.record_failure()
+                retry_count += 1
+                if retry_count < self.MAX_RETRIES:
+                    time.sleep(self.DELAYS['between_retries'])
+                    self._refresh_session()
+        
+        return None
+
+    def _add_metadata(self, df: pd.DataFrame, county: str, market: str, product: str) -> pd.DataFrame:
+        """Add the combination and scrape date as single-category columns in one allocation."""
+        codes = np.zeros(len(df), dtype=np.int8)
+        metadata = {
+            'county': county,
+            'market': market,
+            'product': product,
+            'scrape_date': datetime.now().strftime("%Y-%m-%d")
+        }
+        return df.assign(**{
+            name: pd.Categorical.from_codes(codes, categories=[value])
+            for name, value in metadata.items()
+        })
+
+    def _maybe_recycle_driver(self):
+        """Restart Chrome once it has served DRIVER_RECYCLE_EVERY scrapes."""
+        self._ops_since_restart += 1
+        if self._ops_since_restart >= self.DRIVER_RECYCLE_EVERY:
+            self.logger.info(f"Recycling WebDriver after {self._ops_since_restart} scrapes")
+            self._reinitialize_driver()
+
+    def _discover_search_form(self) -> Optional[Dict]:
+        """Read the search form's fields, option values and date field names in one JS call."""
+        js_script = """
+        var select = document.querySelector("select[name='county[]']");
+        if (!select || !select.form) {
+            return null;
+        }
+        var form = select.form;
+        var fields = [];
+        new FormData(form).forEach(function(value, key) {
+            fields.push([key, value]);
+        });
+        var options = {};
+        Array.prototype.forEach.call(form.querySelectorAll('select'), function(s) {
+            var opts = {};
+            Array.prototype.forEach.call(s.options, function(o) {
+                opts[o.text.trim().toLowerCase()] = o.value;
+            });
+            options[s.name] = opts;
+        });
+        var start = document.getElementById('dateStartSearch');
+        var end = document.getElementById('dateEndSearch');
+        return {
+            action: form.action || window.location.href,
+            method: (form.getAttribute('method') || 'get').toLowerCase(),
+            fields: fields,
+            options: options,
+            dates: {start: start ? start.name : null, end: end ? end.name : null}
+        };
+        """
+        try:
+            form = self.driver.execute_script(js_script)
+        except WebDriverException as e:
+            self.logger.debug(f"Search form discovery failed: {str(e)}")
+            return None
+        if not form:
+            return None
+
+        # Keep option values learned earlier (e.g. markets loaded for another county)
+        for name, opts in form.pop('options').items():
+            self._option_cache.setdefault(name, {}).update(opts)
+        with self._form_lock:
+            if self._search_form is not None:
+                # The session's token only matches the session's own cookies, so keep the pair
+                return self._search_form
+            # The browser's token is only valid with the browser's cookies
+            self._seed_http_cookies(replace=True)
+            self._search_form = form
+        return form
+
+    def _discover_search_form_http(self) -> Optional[Dict]:
+        """Read the search form from the page's HTML, so the HTTP path needs no browser."""
+        try:
+            response = self.http_session.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+        except RequestException as e:
+            self.logger.debug(f"Could not fetch search page over HTTP: {str(e)}")
+            return None
+
+        doc = lxml.html.fromstring(response.text, base_url=response.url)
+        forms = doc.xpath("//select[@name='county[]']/ancestor::form[1]")
+        if not forms:
+            return None
+        form_el = forms[0]
 
-    def main():
-        # Test configuration
-        test_config = {
-            'counties': ["Nairobi"],
-            'products': ["Dry maize"],
-            'markets': ["Nyamakima"],
-            'start_date': "2023-01-01",
-            'end_date': "2023-12-31",
-            'resume': True
+        for select in form_el.xpath(".//select[@name]"):
+            opts = {
+                option.text_content().strip().lower(): option.get('value', option.text_content().strip())
+                for option in select.xpath(".//option")
+            }
+            self._option_cache.setdefault(select.get('name'), {}).update(opts)
+        start = doc.xpath("//*[@id='dateStartSearch']/@name")
+        end = doc.xpath("//*[@id='dateEndSearch']/@name")
+        self._search_form = {
+            'action': form_el.action or response.url,
+            'method': (form_el.get('method') or 'get').lower(),
+            'fields': [list(field) for field in form_el.form_values()],  # Includes hidden CSRF tokens
+            'dates': {'start': start[0] if start else None, 'end': end[0] if end else None}
         }
+        return self._search_form
+
+    def _set_select_value(self, name: str, value: str) -> bool:
+        """
+        Select an option by visible text in one JS call.
         
-        # Full configuration
-        full_config = {
-            'counties': ["Nairobi", "Mombasa", "Kisumu"],  # Add all counties
-            'products': ["Dry maize", "Beans", "Rice"],     # Add all products
-            'markets': ["Nyamakima", "City Market"],        # Add all markets
-            'start_date': "2023-01-01",
-            'end_date': "2023-12-31",
-            'resume': True
+        A cached option value is preferred; otherwise the option is matched by text,
+        ignoring case and runs of whitespace. The select's options are cached either way.
+        """
+        key = value.strip().lower()
+        result = self.driver.execute_script("""
+        var select = document.querySelector("select[name='" + arguments[0] + "']");
+        if (!select) {
+            return {status: 'missing'};
+        }
+        var normalize = function(text) {
+            return text.replace(/\\s+/g, ' ').trim().toLowerCase();
+        };
+        var wanted = normalize(arguments[2]);
+        var options = {};
+        var byValue = null;
+        var byText = null;
+        for (var i = 0; i < select.options.length; i++) {
+            var option = select.options[i];
+            options[option.text.trim().toLowerCase()] = option.value;
+            if (byValue === null && arguments[1] !== null && option.value === arguments[1]) {
+                byValue = option;
+            }
+            if (byText === null && normalize(option.text) === wanted) {
+                byText = option;
+            }
         }
+        var match = byValue || byText;
+        if (match === null) {
+            return {status: 'not_found', options: options};
+        }
+        select.value = match.value;
+        select.dispatchEvent(new Event('change', { bubbles: true }));
+        return {status: 'ok', matched: match.text.trim(), options: options};
+        """, name, self._option_cache.get(name, {}).get(key), value)
+        
+        if result.get('options'):
+            self._option_cache.setdefault(name, {}).update(result['options'])
+        if result['status'] == 'ok':
+            self.logger.debug("Selected '%s' for %s", result['matched'], name)
+            return True
+        if result['status'] == 'missing':
+            self.logger.warning(f"Select {name} not found")
+        else:
+            self.logger.warning(f"Option '{value}' not found for {name}")
+        return False
+
+    def _options_signature(self, name: str) -> Optional[str]:
+        """Values and labels of a select's options as one string, or None while it only has its placeholder."""
+        return self.driver.execute_script(
+            "var s = document.querySelector(\"select[name='\" + arguments[0] + \"']\");"
+            "if (!s || s.options.length <= 1) return null;"
+            "return Array.prototype.map.call(s.options, function(o) {"
+            "    return o.value + '\\u0001' + o.text;"
+            "}).join('\\u0002');",
+            name
+        )
+
+    def set_filters(self, county: str, market: str, product: str,
+                    start_date: str, end_date: str, entries: str = "100") -> bool:
+        """
+        Set every search filter and submit the form.
         
+        County goes first since changing it reloads the market options; market, product,
+        rows per page and both dates don't depend on each other and are set in one JS call.
+        """
         try:
-            # Initialize scraper
-            scraper = AMISScraper(headless=True, timeout=120)
-            
-            # Run test configuration first
-            scraper.logger.info("Starting test run...")
-            test_df = scraper.run_all(
-                counties=test_config['counties'],
-                products=test_config['products'],
-                markets=test_config['markets'],
-                start_date=test_config['start_date'],
-                end_date=test_config['end_date'],
-                resume=test_config['resume']
+            self.logger.info("Setting filters for %s in %s, %s", product, market, county)
+            # Already on the search page: clear the form in place instead of reloading it
+            on_search_page = (
+                self.driver.current_url.split('?')[0].rstrip('/') == self.url.rstrip('/')
+                and self.driver.execute_script(
+                    "var s = document.querySelector(\"select[name='county[]']\");"
+                    "if (!s || !s.form) return false;"
+                    "s.form.reset();"
+                    "return true;"
+                )
             )
+            if not on_search_page:
+                self.driver.get(self.url)
+                self._wait_for_page_load()
             
-            if test_df is not None:
-                scraper.logger.info("Test run completed successfully!")
-                
-                # If test run is successful, proceed with full configuration
-                scraper.logger.info("Starting full run...")
-                full_df = scraper.run_all(
-                    counties=full_config['counties'],
-                    products=full_config['products'],
-                    markets=full_config['markets'],
-                    start_date=full_config['start_date'],
-                    end_date=full_config['end_date'],
-                    resume=full_config['resume']
+            # form.reset() leaves the previous county's markets in place, so remember them
+            # and wait for the list to change rather than sleeping a fixed time
+            previous_markets = self._options_signature('market[]')
+            if not self._set_select_value('county[]', county):
+                return False
+            try:
+                WebDriverWait(self.driver, self.DELAYS['after_filter'], poll_frequency=0.1).until(
+                    lambda d: self._options_signature('market[]') not in (None, previous_markets)
                 )
-                
-                if full_df is not None:
-                    scraper.logger.info("Full run completed successfully!")
-                else:
-                    scraper.logger.error("Full run failed to collect data")
-            else:
-                scraper.logger.error("Test run failed to collect data")
+            except TimeoutException:
+                self.logger.debug("Market options did not reload for %s", county)
+            
+            missing = self.driver.execute_script("""
+            var normalize = function(text) {
+                return text.replace(/\\s+/g, ' ').trim().toLowerCase();
+            };
+            var fire = function(el) {
+                el.dispatchEvent(new Event('input', { bubbles: true }));
+                el.dispatchEvent(new Event('change', { bubbles: true }));
+                if (window.jQuery) jQuery(el).trigger('change');
+            };
+            var setSelect = function(name, text) {
+                var select = document.querySelector("select[name='" + name + "']");
+                if (!select) return false;
+                var wanted = normalize(text);
+                for (var i = 0; i < select.options.length; i++) {
+                    if (normalize(select.options[i].text) === wanted) {
+                        select.selectedIndex = i;
+                        fire(select);
+                        return true;
+                    }
+                }
+                return false;
+            };
+            var setDate = function(id, value) {
+                var input = document.getElementById(id);
+                if (!input) return false;
+                input.removeAttribute('readonly');
+                input.value = value;
+                fire(input);
+                return input.value === value;
+            };
+            var results = {
+                'market[]': setSelect('market[]', arguments[0]),
+                'product[]': setSelect('product[]', arguments[1]),
+                'per_page': setSelect('per_page', arguments[2]),
+                'dateStartSearch': setDate('dateStartSearch', arguments[3]),
+                'dateEndSearch': setDate('dateEndSearch', arguments[4])
+            };
+            return Object.keys(results).filter(function(key) { return !results[key]; });
+            """, market, product, str(entries), start_date, end_date)
+            if missing:
+                self.logger.error(f"Failed to set filters: {', '.join(missing)}")
+                return False
+            
+            form = self.driver.find_element(By.CSS_SELECTOR, "select[name='county[]']")
+            self.driver.find_element(*self.SUBMIT_LOCATOR).click()
+            # The search is a full form post: wait for the old page to go, then the new one
+            self.wait.until(EC.staleness_of(form))
+            self._wait_for_page_load()
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error in set_filters: {str(e)}")
+            return False
+
+    def scrape_table(self) -> Optional[pd.DataFrame]:
+        """Scrape data from the results table."""
+        try:
+            self.logger.info("Starting table scraping")
+            
+            # Wait until the table has rows rather than sleeping a fixed time
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "table.table-bordered tbody tr"))
+            )
         
+            # Fetch only the table's markup and let libxml2 parse it into typed columns
+            html = self.driver.execute_script(
+                "const table = document.querySelector('table.table-bordered');"
+                "return table ? table.outerHTML : null;"
+            )
+            if not html:
+                self.logger.warning("No data found in table")
+                return None
+            
+            df = pd.read_html(io.StringIO(html), flavor='lxml')[0]
+            self.logger.debug("Headers found: %s, count: %d", df.columns, len(df.columns))
+            
+            # Validate data
+            if df.empty:
+                self.logger.warning("No data found in table")
+                return None
+            
+            # Strip and blank out text cells column by column rather than cell by cell
+            text_cols = df.columns[df.dtypes == object]
+            df[text_cols] = df[text_cols].apply(lambda col: col.str.strip()).replace('', np.nan)
+            df = df.dropna(axis=1, how='all')  # Drop entirely empty columns
+            df = _apply_column_types(df)
+            
+            self.logger.info("Successfully scraped %d rows of data", len(df))
+            return df
+
         except Exception as e:
-            scraper.logger.critical(f"Critical error in main process: {str(e)}", exc_info=True)
+            self.logger.error(f"Error scraping table: {str(e)}")
+            return None
+
+    def _build_search_payload(self, county: str, market: str, product: str,
+                              start_date: str, end_date: str,
+                              entries: str) -> Optional[List[Tuple[str, str]]]:
+        """Build the form payload for a search, or None if a value can't be resolved."""
+        form = self._search_form
+        if not form or not form['dates']['start'] or not form['dates']['end']:
+            return None
+
+        values = {
+            'county[]': county,
+            'market[]': market,
+            'product[]': product,
+            'per_page': entries
+        }
+        payload = []
+        for name, text in values.items():
+            value = self._option_cache.get(name, {}).get(text.strip().lower())
+            if value is None:
+                self.logger.debug("No option value known for %s=%s", name, text)
+                return None
+            payload.append((name, value))
+        payload.append((form['dates']['start'], start_date))
+        payload.append((form['dates']['end'], end_date))
+
+        overridden = set(values) | {form['dates']['start'], form['dates']['end']}
+        payload.extend((k, v) for k, v in form['fields'] if k not in overridden)
+        return payload
+
+    def _fetch_table_http(self, county: str, market: str, product: str,
+                          start_date: str, end_date: str,
+                          use_browser: bool = True,
+                          bucket: Optional[_TokenBucket] = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch the results table by submitting the search form over HTTP.
         
-        finally:
+        Returns None whenever the browser path should be used instead. With
+        use_browser=False the WebDriver is never touched, so worker threads can call it.
+        Throttling responses slow down bucket, which defaults to the scraper's own.
+        """
+        if self._search_form is None and not self._discover_search_form_http():
+            if not use_browser:
+                return None
             try:
-                scraper.driver.quit()
-                scraper.logger.info("Browser closed successfully")
+                self.driver.get(self.url)
+                self._wait_for_page_load()
             except Exception as e:
-                scraper.logger.error(f"Error closing browser: {str(e)}")
+                self.logger.debug(f"Could not load search page for form discovery: {str(e)}")
+                return None
+            if not self._discover_search_form():
+                return None
+
+        entries = str(self.entry_options[-1])
+        generation = self._form_generation
+        payload = self._build_search_payload(county, market, product, start_date, end_date, entries)
+        if payload is None:
+            return None
+
+        if use_browser:
+            self._seed_http_cookies()
+
+        try:
+            response = self._submit_search(payload)
+            if response.status_code in (403, 419):
+                # The CSRF token or session expired; retry once with a freshly fetched form
+                if self._refresh_search_form(generation):
+                    payload = self._build_search_payload(county, market, product,
+                                                         start_date, end_date, entries)
+                    if payload is None:
+                        return None
+                    response = self._submit_search(payload)
+            if response.status_code in (429, 503):
+                (bucket or self._bucket).record_failure()
+            response.raise_for_status()
+        except RequestException as e:
+            self.logger.warning(f"HTTP search failed, falling back to browser: {str(e)}")
+            return None
+
+        try:
+            df = _read_results_table(response.text)
+        except ValueError:  # Table present but without parsable rows
+            df = None
+        if df is None or df.empty:
+            self.logger.info("No results table in HTTP response for %s/%s/%s, using the browser",
+                             county, market, product)
+            return None
+        df = _apply_column_types(df)
+
+        match = _ENTRIES_RE.search(response.text)
+        if match and not self._verify_data_completeness(df, int(match.group(1))):
+            self.logger.info("Incomplete HTTP results for %s/%s/%s, using the browser",
+                             county, market, product)
+            return None
+
+        self.logger.info("Fetched %d rows over HTTP", len(df))
+        return df
+
+    def _refresh_search_form(self, seen_generation: int) -> bool:
+        """
+        Re-fetch the search form and session after a 403/419, once for all threads.
+        
+        A thread whose request used an older form than the current one reuses the
+        form another thread already fetched instead of clearing the session again.
+        """
+        with self._form_lock:
+            if self._form_generation != seen_generation:
+                return self._search_form is not None
+            self.http_session.cookies.clear()
+            if not self._discover_search_form_http():
+                return False
+            self._form_generation += 1
+            return True
+
+    def _seed_http_cookies(self, replace: bool = False):
+        """
+        Copy the browser's cookies into the HTTP session once; it keeps its own afterwards.
+        
+        replace=True drops the session's cookies first, for when it adopts the browser's form.
+        """
+        if replace:
+            self.http_session.cookies.clear()
+        elif self.http_session.cookies:
+            return
+        try:
+            for cookie in self.driver.get_cookies():
+                self.http_session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        except WebDriverException as e:
+            self.logger.debug(f"Could not copy browser cookies: {str(e)}")
+
+    def _submit_search(self, payload: List[Tuple[str, str]]) -> requests.Response:
+        """Send the search form with the method it declares, over the pooled session."""
+        form = self._search_form
+        if form['method'] == 'post':
+            return self.http_session.post(form['action'], data=payload, timeout=self.timeout)
+        return self.http_session.get(form['action'], params=payload, timeout=self.timeout)
+
+    def _fetch_job(self, job: Dict, bucket: _TokenBucket,
+                   use_browser: bool = False) -> Optional[pd.DataFrame]:
+        """Fetch one job over HTTP and tag it, or return None if the browser is needed."""
+        # Worker threads share one rate limit instead of hitting the site at full concurrency
+        bucket.acquire()
+        df = self._fetch_table_http(job['county'], job['market'], job['product'],
+                                    job['start_date'], job['end_date'],
+                                    use_browser=use_browser, bucket=bucket)
+        if df is None:
+            return None
+        bucket.record_success()
+        return self._add_metadata(df, job['county'], job['market'], job['product'])
+
+    def iter_many(self, jobs: List[Dict], concurrency: int = 16) -> Iterator[Optional[pd.DataFrame]]:
+        """
+        Yield each job's scraped rows in job order, fetching them over HTTP concurrently.
+        
+        Jobs the HTTP path can't serve go through the browser, one at a time, and
+        yield None if that fails too.
+        
+        Args:
+            jobs: Dicts with county, market, product, start_date and end_date keys
+            concurrency: Maximum number of searches in flight at once
+        """
+        if not jobs:
+            return
+        
+        # Each worker keeps the single-scraper spacing between its own requests;
+        # the whole batch backs off together when the site throttles
+        bucket = _TokenBucket(rate=concurrency / self.DELAYS['between_requests'],
+                              capacity=concurrency, max_rate=float(concurrency))
+        
+        # The first fetch discovers the form and the cookies are copied before any
+        # worker starts, so the workers never touch the browser
+        first = self._fetch_job(jobs[0], bucket, use_browser=True)
+        self._seed_http_cookies()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if self._search_form is not None:
+                rest = executor.map(functools.partial(self._fetch_job, bucket=bucket), jobs[1:])
+            else:
+                rest = itertools.repeat(None, len(jobs) - 1)
+            
+            for job, df in zip(jobs, itertools.chain([first], rest)):
+                if df is None:
+                    # The HTTP search already failed for this job, so go straight to the browser
+                    df = self._scrape_combination(
+                        job['county'], job['market'], job['product'], job['start_date'], job['end_date'],
+                        try_http=False
+                    )
+                yield df
 
+    def run_many(self, jobs: List[Dict], concurrency: int = 16) -> Optional[pd.DataFrame]:
+        """
+        Scrape many combinations into one DataFrame; see iter_many.
+        
+        Returns:
+            Optional[pd.DataFrame]: All scraped rows, or None if nothing was scraped
+        """
+        frames = [df for df in self.iter_many(jobs, concurrency) if df is not None]
+        self.logger.info(f"Scraped {len(frames)} of {len(jobs)} combinations")
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True, copy=False, sort=False)
+
+    def run_many_to_csv(self, jobs: List[Dict], output_file: str, concurrency: int = 16) -> int:
+        """
+        Scrape many combinations straight into a CSV file, one job's rows at a time.
+        
+        Rows are written as each job arrives instead of being concatenated at the end.
+        The header comes from the first job; later jobs are aligned to it, since browser
+        fallbacks drop empty columns and can return them in a different order.
+
+        Returns:
+            int: Number of rows written
+        """
+        rows_written = 0
+        columns = None
+        with open(output_file, 'w', newline='') as f:
+            for df in self.iter_many(jobs, concurrency):
+                if df is None:
+                    continue
+                if columns is None:
+                    columns = list(df.columns)
+                    df.to_csv(f, index=False)
+                else:
+                    extra = [col for col in df.columns if col not in columns]
+                    if extra:
+                        self.logger.warning(f"Dropping columns missing from the CSV header: {extra}")
+                    df.reindex(columns=columns).to_csv(f, header=False, index=False)
+                rows_written += len(df)
+        self.logger.info(f"Wrote {rows_written} rows to {output_file}")
+        return rows_written
 
     def _save_intermediate_data(self, 
                               df: pd.DataFrame, 
                               county: str, 
                               market: str, 
-                              product: str):
-        """Save intermediate results to CSV."""
-        filename = (
-            f"amis_data_{county}_{market}_{product}_"
-            f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                              product: str) -> str:
+        """Save intermediate results as a Parquet part and return its path."""
+        part_dir = os.path.join(self.dirs['exports'], 'parts', county, market, product)
+        os.makedirs(part_dir, exist_ok=True)
+        filepath = os.path.join(
+            part_dir, f"part-{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.parquet"
+        )
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False), filepath, compression="zstd"
         )
-        filepath = os.path.join(self.dirs['exports'], filename)
-        df.to_csv(filepath, index=False)
         self.logger.info(f"Saved intermediate data to {filepath}")
+        return filepath
 
-    def _save_final_results(self, all_data: List[pd.DataFrame]) -> pd.DataFrame:
-        """Consolidate and save final results."""
-        final_df = pd.concat(all_data, ignore_index=True)
+    def _save_final_results(self, part_files: List[str],
+                            start_date: Optional[str] = None,
+                            end_date: Optional[str] = None) -> str:
+        """Stream the Parquet parts written during the run into one Parquet and one CSV file; return the Parquet path."""
+        schema = _merge_schemas([pq.read_schema(path).remove_metadata() for path in part_files])
         
-        # Remove duplicates
-        final_df = final_df.drop_duplicates()
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        parquet_path = os.path.join(self.dirs['exports'], f"amis_data_full_{timestamp}.parquet")
+        final_output_path = os.path.join(self.dirs['exports'], f"amis_data_full_{timestamp}.csv")
         
-        # Save final consolidated CSV
-        final_output_path = os.path.join(
-            self.dirs['exports'],
-            f"amis_data_full_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        )
-        final_df.to_csv(final_output_path, index=False)
+        # Append one part at a time so memory is bounded by the largest part,
+        # dropping rows whose fingerprint was already written
+        seen = set()
+        with pq.ParquetWriter(parquet_path, schema, compression="zstd") as writer, \
+                pacsv.CSVWriter(final_output_path, schema) as csv_writer:
+            for path in part_files:
+                part = pq.read_table(path)
+                # Missing columns are filled with nulls rather than dropping the part
+                table = pa.table([
+                    part[field.name].cast(field.type) if field.name in part.column_names
+                    else pa.nulls(len(part), field.type)
+                    for field in schema
+                ], schema=schema)
+                
+                # Drop rows outside the requested window in Arrow, before hashing
+                if 'Date' in schema.names and pa.types.is_timestamp(schema.field('Date').type):
+                    date_type = schema.field('Date').type
+                    if start_date:
+                        table = table.filter(pc.greater_equal(
+                            table['Date'], pa.scalar(pd.Timestamp(start_date), type=date_type)))
+                    if end_date:
+                        table = table.filter(pc.less_equal(
+                            table['Date'], pa.scalar(pd.Timestamp(end_date), type=date_type)))
+                
+                hashes = pd.util.hash_pandas_object(table.to_pandas(), index=False)
+                keep = ~hashes.duplicated() & ~hashes.isin(seen)
+                seen.update(hashes[keep])
+                table = table.filter(pa.array(keep.to_numpy()))
+                
+                writer.write_table(table)
+                csv_writer.write_table(table)
         self.logger.info(f"Saved final consolidated data to {final_output_path}")
-        
-        return final_df
-
-# Usage example
-def run_all(self, 
-            counties: List[str],
-            products: List[str],
-            markets: List[str],
-            start_date: str = "2022-01-01",
-            end_date: str = None,
-            resume: bool = True) -> Optional[pd.DataFrame]:
-    """
-    Run the complete scraping process.
-    
-    Args:
-        counties: List of counties to scrape
-        products: List of products to scrape
-        markets: List of markets to scrape
-        start_date: Start date for data collection
-        end_date: End date for data collection (defaults to current date)
-        resume: Whether to resume from last saved progress
-    """
-    end_date = end_date or datetime.now().strftime("%Y-%m-%d")
-    all_data = []
+        return parquet_path
+
+    def run_all(self, 
+                counties: List[str],
+                products: List[str],
+                markets: List[str],
+                start_date: str = "2022-01-01",
+                end_date: str = None,
+                resume: bool = True,
+                max_workers: int = 1) -> Optional[pd.DataFrame]:
+        """
+        Run the complete scraping process and load the results.
     
-    try:
-        # Resume from last progress if requested
-        if resume and self.progress['last_county']:
-            start_idx = {
-                'county': counties.index(self.progress['last_county']),
-                'market': markets.index(self.progress['last_market']),
-                'product': products.index(self.progress['last_product'])
-            }
-        else:
-            start_idx = {'county': 0, 'market': 0, 'product': 0}
+        Args:
+            counties: List of counties to scrape
+            products: List of products to scrape
+            markets: List of markets to scrape
+            start_date: Start date for data collection
+            end_date: End date for data collection (defaults to current date)
+            resume: Whether to resume from last saved progress
+            max_workers: Number of browser processes to scrape with in parallel
+        
+        Returns:
+            Optional[pd.DataFrame]: All scraped rows; use run_all_to_parquet to keep
+            large runs out of memory
+        """
+        parquet_path = self.run_all_to_parquet(counties, products, markets, start_date,
+                                               end_date, resume, max_workers)
+        if parquet_path is None:
+            return None
+        return pd.read_parquet(parquet_path)
+
+    def run_all_to_parquet(self, 
+                           counties: List[str],
+                           products: List[str],
+                           markets: List[str],
+                           start_date: str = "2022-01-01",
+                           end_date: str = None,
+                           resume: bool = True,
+                           max_workers: int = 1) -> Optional[str]:
+        """
+        Run the complete scraping process, leaving the results on disk.
         
-        for county_idx in range(start_idx['county'], len(counties)):
-            county = counties[county_idx]
+        Takes the same arguments as run_all. Memory is bounded by the largest
+        combination, since every part is streamed into the final files.
+        
+        Returns:
+            Optional[str]: Path of the consolidated Parquet file; a CSV copy is written next to it
+        """
+        end_date = end_date or datetime.now().strftime("%Y-%m-%d")
+        part_files = []
+    
+        try:
+            if max_workers > 1:
+                tasks = [
+                    (county, market, product, start_date, end_date,
+                     {'url': self.url, 'headless': True, 'timeout': self.timeout,
+                      'remote_url': self.remote_url, 'log_level': self.logger.level})
+                    for county in counties
+                    for market in markets
+                    for product in products
+                    if not self._is_completed(county, market, product)
+                ]
+                manager = multiprocessing.Manager()
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=min(max_workers, os.cpu_count() or 1),
+                        initializer=_init_worker,
+                        initargs=(manager.Lock(), manager.Value('d', 0.0))
+                    ) as executor:
+                        futures = {executor.submit(_scrape_one, task): task[:3] for task in tasks}
+                        for future in as_completed(futures):
+                            county, market, product = futures[future]
+                            try:
+                                df = future.result()[3]
+                            except Exception as e:
+                                self.logger.error(
+                                    f"Worker failed on {county}/{market}/{product}: {str(e)}"
+                                )
+                                continue
+                            if df is None:
+                                self.logger.warning(
+                                    f"No data collected for {county}/{market}/{product}"
+                                )
+                                continue
+                            part_files.append(
+                                self._save_intermediate_data(df, county, market, product)
+                            )
+                            self._save_progress(county, market, product)
+                finally:
+                    manager.shutdown()
+            else:
+                # Resume from last progress if requested
+                if resume and self.progress['last_county']:
+                    start_idx = {
+                        'county': counties.index(self.progress['last_county']),
+                        'market': markets.index(self.progress['last_market']),
+                        'product': products.index(self.progress['last_product'])
+                    }
+                else:
+                    start_idx = {'county': 0, 'market': 0, 'product': 0}
             
-            for market_idx in range(start_idx['market'], len(markets)):
-                market = markets[market_idx]
+                for county_idx in range(start_idx['county'], len(counties)):
+                    county = counties[county_idx]
                 
-                for product_idx in range(start_idx['product'], len(products)):
-                    product = products[product_idx]
-                    
-                    # Skip if already completed
-                    if any(c['county'] == county and 
-                          c['market'] == market and 
-                          c['product'] == product 
-                          for c in self.progress['completed']):
-                        continue
+                    for market_idx in range(start_idx['market'], len(markets)):
+                        market = markets[market_idx]
                     
-                    retry_count = 0
-                    while retry_count < self.MAX_RETRIES:
-                        try:
-                            self.logger.info(
-                                f"Scraping: County={county}, Market={market}, "
-                                f"Product={product}, Attempt={retry_count + 1}"
-                            )
-                            
-                            # Set filters and get total entries
-                            if not self.set_filters(county, market, product, 
-                                                  start_date, end_date, "100"):
-                                raise Exception("Failed to set filters")
-                            
-                            total_entries = self._get_total_entries()
-                            if not total_entries:
-                                self.logger.warning("No entries found, skipping...")
-                                break
-                            
-                            # Optimize entries per page
-                            optimal_entries = self._optimize_entries(total_entries)
+                        for product_idx in range(start_idx['product'], len(products)):
+                            product = products[product_idx]
+                        
+                            # Skip if already completed
+                            if self._is_completed(county, market, product):
+                                continue
+                        
+                            df = self._scrape_combination(county, market, product,
+                                                          start_date, end_date)
+                            if df is None:
+                                self.logger.warning(
+                                    f"No data collected for {county}/{market}/{product}"
+                                )
+                            else:
+                                # Stream results to disk rather than holding them in memory
+                                part_files.append(
+                                    self._save_intermediate_data(df, county, market, product)
+                                )
                             
-                            # Reset filters with optimal entries
-                            if not self.set_filters(county, market, product,
-                                                  start_date, end_date, 
-                                                  str(optimal_entries)):
-                                raise Exception("Failed to set optimized filters")
-                            
-                            # Scrape data
-                            df = self.scrape_table()
-                            
-                            # Verify data completeness
-                            if self._verify_data_completeness(df, total_entries):
-                                # Add metadata
-                                df['county'] = county
-                                df['market'] = market
-                                df['product'] = product
-                                df['scrape_date'] = datetime.now().strftime("%Y-%m-%d")
-                                
-                                # Save intermediate results
-                                self._save_intermediate_data(df, county, market, product)
-                                all_data.append(df)
-                                
                                 # Update progress
                                 self._save_progress(county, market, product)
-                                break
-                            
-                            retry_count += 1
-                            time.sleep(self.DELAYS['between_retries'])
-                            self._refresh_session()
-                            
-                        except Exception as e:
-                            self.logger.error(
-                                f"Error scraping {county}/{market}/{product}: {str(e)}"
-                            )
-                            retry_count += 1
-                            if retry_count < self.MAX_RETRIES:
-                                time.sleep(self.DELAYS['between_retries'])
-                                self._refresh_session()
+                                self._maybe_recycle_driver()
                     
-                    time.sleep(self.DELAYS['between_requests'])
+                        # Reset product index when moving to next market
+                        start_idx['product'] = 0
                 
-                # Reset product index when moving to next market
-                start_idx['product'] = 0
-            
-            # Reset market index when moving to next county
-            start_idx['market'] = 0
+                    # Reset market index when moving to next county
+                    start_idx['market'] = 0
+    
+        except Exception as e:
+            self.logger.critical(f"Critical error in scraping process: {str(e)}")
+            return None
+    
+        finally:
+            self._write_progress_snapshot()
+    
+        # Consolidate and save final results
+        if part_files:
+            return self._save_final_results(part_files, start_date, end_date)
     
-    except Exception as e:
-        self.logger.critical(f"Critical error in scraping process: {str(e)}")
         return None
+
+
+# Per-process state for parallel runs
+_worker_scraper = None
+_worker_lock = None
+_worker_next_slot = None
+
+def _init_worker(lock, next_slot):
+    """Store the shared rate-limiter state in each worker process."""
+    global _worker_lock, _worker_next_slot
+    _worker_lock = lock
+    _worker_next_slot = next_slot
+    # Worker processes skip atexit handlers, but run multiprocessing finalizers
+    multiprocessing.util.Finalize(None, _shutdown_all, exitpriority=10)
+
+def _throttle(interval: float):
+    """Wait for the next request slot shared by all workers."""
+    with _worker_lock:
+        now = time.time()
+        wait = _worker_next_slot.value - now
+        _worker_next_slot.value = max(now, _worker_next_slot.value) + interval
+    if wait > 0:
+        time.sleep(wait)
+
+def _scrape_one(task: Tuple) -> Tuple[str, str, str, Optional[pd.DataFrame]]:
+    """Scrape one combination in a worker process with its own browser."""
+    global _worker_scraper
+    county, market, product, start_date, end_date, config = task
+    if _worker_scraper is None:
+        _worker_scraper = AMISScraper(**config)
+    _throttle(AMISScraper.DELAYS['between_requests'])
+    return county, market, product, _worker_scraper._scrape_combination(
+        county, market, product, start_date, end_date
+    )
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Scrape market prices from AMIS Kenya.")
+    parser.add_argument(
+        '--pool', action='store_true',
+        help="scrape the full configuration's last six months on a pool of browsers, one CSV per combination"
+    )
+    args = parser.parse_args(argv)
     
-    finally:
-        self.driver.quit()
+    # Signal handlers can only be installed from the main thread, so it happens here
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     
-    # Consolidate and save final results
-    if all_data:
-        return self._save_final_results(all_data)
+    # Test configuration
+    test_config = {
+        'counties': ["Nairobi"],
+        'products': ["Dry maize"],
+        'markets': ["Nyamakima"],
+        'start_date': "2023-01-01",
+        'end_date': "2023-12-31",
+        'resume': True
+    }
     
-    return None
+    # Full configuration
+    full_config = {
+        'counties': ["Nairobi", "Mombasa", "Kisumu"],  # Add all counties
+        'products': ["Dry maize", "Beans", "Rice"],     # Add all products
+        'markets': ["Nyamakima", "City Market"],        # Add all markets
+        'start_date': "2023-01-01",
+        'end_date': "2023-12-31",
+        'resume': True
+    }
+    
+    if args.pool:
+        scrape_with_pool([
+            (county, market, product)
+            for county in full_config['counties']
+            for market in full_config['markets']
+            for product in full_config['products']
+        ])
+        return
+    
+    # One browser serves both runs; it is quit when the block exits
+    with AMISScraper(headless=True, timeout=120) as scraper:
+        try:
+            # Run test configuration first
+            scraper.logger.info("Starting test run...")
+            test_path = scraper.run_all_to_parquet(
+                counties=test_config['counties'],
+                products=test_config['products'],
+                markets=test_config['markets'],
+                start_date=test_config['start_date'],
+                end_date=test_config['end_date'],
+                resume=test_config['resume']
+            )
+
+            if test_path is not None:
+                scraper.logger.info("Test run completed successfully!")
+
+                # If test run is successful, proceed with full configuration
+                scraper.logger.info("Starting full run...")
+                full_path = scraper.run_all_to_parquet(
+                    counties=full_config['counties'],
+                    products=full_config['products'],
+                    markets=full_config['markets'],
+                    start_date=full_config['start_date'],
+                    end_date=full_config['end_date'],
+                    resume=full_config['resume']
+                )
+
+                if full_path is not None:
+                    scraper.logger.info("Full run completed successfully!")
+                else:
+                    scraper.logger.error("Full run failed to collect data")
+            else:
+                scraper.logger.error("Test run failed to collect data")
+
+        except Exception as e:
+            scraper.logger.critical(f"Critical error in main process: {str(e)}", exc_info=True)
 
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
@@ -456,118 +1490,64 @@ class DatePickerHandler:
         self.logger = logger
         self.wait = WebDriverWait(driver, wait_timeout)
 
-    def _validate_dates(self, start_date: str, end_date: str) -> bool:
-        """Validate date formats and ensure the end date is not earlier than the start date."""
+    def _validate_dates(self, start_date, end_date) -> Optional[Tuple[datetime, datetime]]:
+        """Parse both dates once; None if malformed or the end is earlier than the start."""
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
+            start = start_date if isinstance(start_date, datetime) else datetime.strptime(start_date, "%Y-%m-%d")
+            end = end_date if isinstance(end_date, datetime) else datetime.strptime(end_date, "%Y-%m-%d")
             if end < start:
                 self.logger.error("End date cannot be earlier than start date.")
-                return False
-            return True
+                return None
+            return start, end
         except ValueError:
             self.logger.error("Invalid date format. Use YYYY-MM-DD.")
-            return False
+            return None
 
-    def _parse_caption(self, caption_text: str) -> datetime:
-        """Parse the caption text in format 'Month, YYYY'."""
-        if not caption_text or caption_text.isspace():
-            raise ValueError("Empty or whitespace caption")
+    def _set_date_in_calendar(self, target_date: datetime, field_id: str) -> bool:
+        """
+        Set a date by writing it into the input behind the Zebra DatePicker.
         
+        The input accepts YYYY-MM-DD directly, so the widget itself is never opened.
+        """
+        date_str = target_date.strftime("%Y-%m-%d")
         try:
-            # The caption format is consistently "Month, YYYY" as seen in the HTML
-            return datetime.strptime(caption_text.strip(), "%B, %Y")
-        except ValueError as e:
-            self.logger.error(f"Failed to parse caption: {caption_text}")
-            raise e
-
-    def _navigate_to_month_year(self, datepicker, target_date: datetime):
-        """Navigate to the correct month and year in the date picker."""
-        max_attempts = 24
-        attempts = 0
-
-        while attempts < max_attempts:
-            try:
-                # Using more specific selector for the caption
-                caption = datepicker.find_element(By.CSS_SELECTOR, "table.dp_header td.dp_caption")
-                current_date = self._parse_caption(caption.text.strip())
-
-                if current_date.year < target_date.year or \
-                   (current_date.year == target_date.year and current_date.month < target_date.month):
-                    next_button = datepicker.find_element(By.CSS_SELECTOR, "table.dp_header td.dp_next")
-                    next_button.click()
-                elif current_date.year > target_date.year or \
-                     (current_date.year == target_date.year and current_date.month > target_date.month):
-                    prev_button = datepicker.find_element(By.CSS_SELECTOR, "table.dp_header td.dp_previous")
-                    prev_button.click()
-                else:
-                    break
-
-                time.sleep(0.5)
-                attempts += 1
-            except Exception as e:
-                self.logger.warning(f"Navigation attempt {attempts + 1} failed: {str(e)}")
-                time.sleep(1)
-                attempts += 1
-        if attempts >= max_attempts:
-            raise ValueError("Failed to navigate to target month/year within maximum attempts.")
-
-    def _set_date_in_calendar(self, date_str: str, field_id: str) -> bool:
-        """Set the given date using the Zebra DatePicker widget."""
-        try:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d")
-            
-            # Open the date picker
-            date_input = self.wait.until(EC.presence_of_element_located((By.ID, field_id)))
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", date_input)
-            time.sleep(0.5)
-            date_input.click()
-            time.sleep(1)
-
-            # Locate the date picker
-            datepicker = self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div.Zebra_DatePicker:not(.dp_hidden)")
-            ))
-
-            # Navigate to the correct month/year
-            self._navigate_to_month_year(datepicker, target_date)
-
-            # Select the day
-            days = datepicker.find_elements(
-                By.CSS_SELECTOR,
-                "table.dp_daypicker td:not(.dp_not_in_month):not(.dp_disabled)"
-            )
-            for day in days:
-                if day.text.strip() == str(target_date.day):
-                    day.click()
-                    time.sleep(0.5)
-
-                    # Verify the date is set
-                    actual_value = date_input.get_attribute("value")
-                    if actual_value == date_str:
-                        self.logger.info(f"Successfully set date to {date_str}")
-                        return True
-                    else:
-                        self.logger.error(f"Date not set correctly. Expected {date_str}, got {actual_value}.")
-                        return False
-            self.logger.error(f"Target day {target_date.day} not found in date picker.")
-            return False
+            self.wait.until(EC.presence_of_element_located((By.ID, field_id)))
+            # Fire the events the page listens for and read the value back in the same call
+            actual_value = self.driver.execute_script("""
+            const el = document.getElementById(arguments[0]);
+            if (!el) return null;
+            el.removeAttribute('readonly');
+            el.value = arguments[1];
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+            if (window.jQuery) jQuery(el).trigger('change').trigger('blur');
+            return el.value;
+            """, field_id, date_str)
         except Exception as e:
-            self.logger.error(f"Error setting date in calendar: {str(e)}")
+            self.logger.error(f"Error setting date: {str(e)}")
             return False
+        
+        if actual_value == date_str:
+            self.logger.debug("Set %s to %s", field_id, date_str)
+            return True
+        self.logger.error(f"Date not set correctly. Expected {date_str}, got {actual_value}.")
+        return False
 
-    def _set_dates(self, start_date: str, end_date: str, max_retries: int = 3) -> bool:
-        """Set start and end dates using the date picker, with retries."""
-        if not self._validate_dates(start_date, end_date):
+    def _set_dates(self, start_date, end_date, max_retries: int = 3) -> bool:
+        """Set start and end dates (YYYY-MM-DD strings or datetimes) using the date picker, with retries."""
+        dates = self._validate_dates(start_date, end_date)
+        if dates is None:
             return False
+        start_dt, end_dt = dates
+        start_date, end_date = start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
 
         for attempt in range(max_retries):
             try:
                 self.logger.info(f"Attempt {attempt + 1} to set dates.")
 
-                if not self._set_date_in_calendar(start_date, "dateStartSearch"):
+                if not self._set_date_in_calendar(start_dt, "dateStartSearch"):
                     continue
-                if not self._set_date_in_calendar(end_date, "dateEndSearch"):
+                if not self._set_date_in_calendar(end_dt, "dateEndSearch"):
                     continue
 
                 # Verify dates
@@ -579,7 +1559,6 @@ class DatePickerHandler:
                     return True
             except Exception as e:
                 self.logger.error(f"Error in setting dates on attempt {attempt + 1}: {str(e)}")
-            time.sleep(2)
         return False
 
 # Utility function to calculate the last six months
@@ -588,145 +1567,6 @@ def get_last_six_months():
     start_date = today - timedelta(days=6 * 30)  # Approximation for 6 months
     return start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
 
-# Example usage
-if __name__ == "__main__":
-    # Initialize the web driver and logger as per your setup
-    driver = ...  # Your Selenium WebDriver instance
-    logger = ...  # Your logging instance
-
-    date_picker_handler = DatePickerHandler(driver, logger)
-
-    # Get the last 6 months date range
-    start_date, end_date = get_last_six_months()
-
-    # Set the date range in the calendar
-    if date_picker_handler._set_dates(start_date, end_date):
-        logger.info(f"Successfully set dates from {start_date} to {end_date}")
-    else:
-        logger.error("Failed to set dates for the last six months.")
-
-def _set_date_in_calendar(self, date_str: str, field_id: str) -> bool:
-    """
-    Set a specific date in the Zebra DatePicker widget.
-
-    Args:
-        date_str: Date in YYYY-MM-DD format.
-        field_id: ID of the date input field.
-
-    Returns:
-        bool: True if the date was set successfully, False otherwise.
-    """
-    try:
-        # Parse the target date
-        target_date = datetime.strptime(date_str, "%Y-%m-%d")
-        self.logger.info(f"Setting date to: {target_date.strftime('%Y-%m-%d')}")
-
-        # Locate and click the input field to open the date picker
-        date_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, field_id))
-        )
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", date_input)
-        time.sleep(0.5)
-        date_input.click()
-        time.sleep(1)  # Wait for date picker to open
-
-        # Locate the active date picker
-        datepicker = self.wait.until(
-            EC.presence_of_element_located((
-                By.CSS_SELECTOR, 
-                "div.Zebra_DatePicker:not(.dp_hidden)"
-            ))
-        )
-
-        # Helper method: Parse caption text to a datetime object
-        def parse_caption(caption_text: str) -> datetime:
-            """Parse caption text in 'Month, YYYY' format."""
-            if not caption_text.strip():
-                raise ValueError("Caption text is empty or invalid")
-            try:
-                return datetime.strptime(caption_text.strip(), "%B, %Y")
-            except ValueError as e:
-                self.logger.error(f"Failed to parse caption: {caption_text}")
-                raise e
-
-        # Helper method: Navigate to the target month/year
-        def navigate_to_target_date():
-            """Navigate the date picker to the target month/year."""
-            max_attempts = 24
-            attempts = 0
-
-            while attempts < max_attempts:
-                try:
-                    # Get the current caption
-                    caption = datepicker.find_element(
-                        By.CSS_SELECTOR, 
-                        "table.dp_header td.dp_caption"
-                    )
-                    current_date = parse_caption(caption.text)
-
-                    # Compare current and target dates
-                    if current_date.year < target_date.year or \
-                        (current_date.year == target_date.year and current_date.month < target_date.month):
-                        next_button = datepicker.find_element(
-                            By.CSS_SELECTOR, 
-                            "table.dp_header td.dp_next"
-                        )
-                        next_button.click()
-                    elif current_date.year > target_date.year or \
-                        (current_date.year == target_date.year and current_date.month > target_date.month):
-                        prev_button = datepicker.find_element(
-                            By.CSS_SELECTOR, 
-                            "table.dp_header td.dp_previous"
-                        )
-                        prev_button.click()
-                    else:
-                        return  # Reached the target month/year
-
-                    time.sleep(0.5)
-                    attempts += 1
-
-                except Exception as e:
-                    self.logger.warning(f"Attempt {attempts + 1}: Failed to navigate: {str(e)}")
-                    attempts += 1
-                    time.sleep(1)
-
-            raise ValueError("Exceeded maximum attempts to navigate to target date")
-
-        # Navigate to the correct month/year
-        navigate_to_target_date()
-
-        # Locate and select the target day
-        days = datepicker.find_elements(
-            By.CSS_SELECTOR,
-            "table.dp_daypicker td:not(.dp_not_in_month):not(.dp_disabled)"
-        )
-        target_day_str = str(target_date.day)
-
-        for day in days:
-            if day.text.strip() == target_day_str:
-                self.logger.info(f"Selecting day: {target_day_str}")
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", day)
-                time.sleep(0.5)
-                day.click()
-                time.sleep(0.5)
-
-                # Validate that the date was set correctly
-                actual_value = date_input.get_attribute("value")
-                expected_value = target_date.strftime("%Y-%m-%d")
-                if actual_value == expected_value:
-                    self.logger.info(f"Date set successfully: {expected_value}")
-                    return True
-                else:
-                    self.logger.error(f"Validation failed. Expected: {expected_value}, Got: {actual_value}")
-                    return False
-
-        self.logger.error(f"Target day {target_day_str} not found")
-        return False
-
-    except Exception as e:
-        self.logger.error(f"Error setting date: {str(e)}")
-        return False
-    
 # def run(self, county: str, product: str, market: str,
     #         start_date: str, end_date: str, 
     #         entries: str = "100",
@@ -762,156 +1602,6 @@ def _set_date_in_calendar(self, date_str: str, field_id: str) -> bool:
     #     output_file="amis_data.csv"
     # )
 
-def scrape_table(self) -> Optional[pd.DataFrame]:
-        """Scrape data from the results table."""
-        try:
-            self.logger.info("Starting table scraping")
-            
-            # Adding delay to allow the table to load completely
-            time.sleep(3)  # Adjust the delay time as needed (e.g., 3 seconds)
-        
-            # Fetch headers
-            headers = [th.text.strip() for th in 
-                    self.driver.find_elements(By.CSS_SELECTOR, "table.table-bordered th")]
-            self.logger.debug(f"Headers found: {headers}, count: {len(headers)}")
-            
-            # Fetch rows
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "table.table-bordered tbody tr")
-            data = []
-            
-            for row in rows:
-                cols = row.find_elements(By.TAG_NAME, "td")
-                cols_data = [col.text.strip() or None for col in cols]
-                
-                # Adjust for mismatched rows
-                if len(cols_data) != len(headers):
-                    self.logger.warning(
-                        f"Row length mismatch: Expected {len(headers)}, got {len(cols_data)}. Adjusting..."
-                    )
-                    cols_data += [None] * (len(headers) - len(cols_data))  # Fill missing columns
-                    cols_data = cols_data[:len(headers)]  # Truncate extra columns
-                
-                self.logger.debug(f"Row data: {cols_data}")
-                data.append(cols_data)
-            
-            # Validate data
-            if not data:
-                self.logger.warning("No data found in table")
-                return None
-            
-            # Create DataFrame
-            df = pd.DataFrame(data, columns=headers)
-            df = df.dropna(axis=1, how='all')  # Drop entirely empty columns
-            
-            self.logger.info(f"Successfully scraped {len(df)} rows of data")
-            return df
-
-        except Exception as e:
-            self.logger.error(f"Error scraping table: {str(e)}")
-            return None
-
-    def main():
-        # Test configuration
-        test_config = {
-            'counties': ["Nairobi"],
-            'products': ["Dry maize"],
-            'markets': ["Nyamakima"],
-            'start_date': "2023-01-01",
-            'end_date': "2023-12-31",
-            'resume': True
-        }
-        
-        # Full configuration
-        full_config = {
-            'counties': ["Nairobi", "Mombasa", "Kisumu"],  # Add all counties
-            'products': ["Dry maize", "Beans", "Rice"],     # Add all products
-            'markets': ["Nyamakima", "City Market"],        # Add all markets
-            'start_date': "2023-01-01",
-            'end_date': "2023-12-31",
-            'resume': True
-        }
-        
-        try:
-            # Initialize scraper
-            scraper = AMISScraper(headless=True, timeout=120)
-            
-            # Run test configuration first
-            scraper.logger.info("Starting test run...")
-            test_df = scraper.run_all(
-                counties=test_config['counties'],
-                products=test_config['products'],
-                markets=test_config['markets'],
-                start_date=test_config['start_date'],
-                end_date=test_config['end_date'],
-                resume=test_config['resume']
-            )
-            
-            if test_df is not None:
-                scraper.logger.info("Test run completed successfully!")
-                
-                # If test run is successful, proceed with full configuration
-                scraper.logger.info("Starting full run...")
-                full_df = scraper.run_all(
-                    counties=full_config['counties'],
-                    products=full_config['products'],
-                    markets=full_config['markets'],
-                    start_date=full_config['start_date'],
-                    end_date=full_config['end_date'],
-                    resume=full_config['resume']
-                )
-                
-                if full_df is not None:
-                    scraper.logger.info("Full run completed successfully!")
-                else:
-                    scraper.logger.error("Full run failed to collect data")
-            else:
-                scraper.logger.error("Test run failed to collect data")
-        
-        except Exception as e:
-            scraper.logger.critical(f"Critical error in main process: {str(e)}", exc_info=True)
-        
-        finally:
-            try:
-                scraper.driver.quit()
-                scraper.logger.info("Browser closed successfully")
-            except Exception as e:
-                scraper.logger.error(f"Error closing browser: {str(e)}")
-
-
-    def _save_intermediate_data(self, 
-                              df: pd.DataFrame, 
-                              county: str, 
-                              market: str, 
-                              product: str):
-        """Save intermediate results to CSV."""
-        filename = (
-            f"amis_data_{county}_{market}_{product}_"
-            f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        )
-        filepath = os.path.join(self.dirs['exports'], filename)
-        df.to_csv(filepath, index=False)
-        self.logger.info(f"Saved intermediate data to {filepath}")
-
-    def _save_final_results(self, all_data: List[pd.DataFrame]) -> pd.DataFrame:
-        """Consolidate and save final results."""
-        final_df = pd.concat(all_data, ignore_index=True)
-        
-        # Remove duplicates
-        final_df = final_df.drop_duplicates()
-        
-        # Save final consolidated CSV
-        final_output_path = os.path.join(
-            self.dirs['exports'],
-            f"amis_data_full_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        )
-        final_df.to_csv(final_output_path, index=False)
-        self.logger.info(f"Saved final consolidated data to {final_output_path}")
-        
-        return final_df
-
-
-
-    from datetime import datetime, timedelta
 import pandas as pd
 import os
 from selenium.webdriver.common.by import By
@@ -924,12 +1614,39 @@ def compute_date_range(months_back=6):
     start_date = today - timedelta(days=months_back * 30)  # Approximate 6 months
     return start_date.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d')
 
+CACHE_DIR = "cache"
+CACHE_TTL = 7 * 24 * 3600  # Seconds before a cached scrape is considered stale
+
+def cache_path(county, market, product, date_range):
+    """Location of the cached scrape for one filter combination and date window."""
+    return os.path.join(CACHE_DIR, county, market, product, f"{date_range[0]}_{date_range[1]}.parquet")
+
+def load_cached(county, market, product, date_range):
+    """Return a cached scrape if one exists and is younger than CACHE_TTL."""
+    path = cache_path(county, market, product, date_range)
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < CACHE_TTL:
+        return pd.read_parquet(path)
+    return None
+
+def store_cached(df, county, market, product, date_range):
+    """Write a scrape to the cache."""
+    path = cache_path(county, market, product, date_range)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_parquet(path, index=False)
+
 def scrape_with_dynamic_entries(driver, county, market, product, date_range):
     """
     Scrape data dynamically, adjusting entries per page until all data for a month is captured.
     """
+    cached = load_cached(county, market, product, date_range)
+    if cached is not None:
+        return cached
+    
+    # Parse the range bounds once rather than on every retry
+    bounds = (pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1]))
+    
     entry_options = [10, 50, 100, 500, 1500, 3000]  # Incrementally larger options
-    for entry_limit in entry_options:
+    for entry_limit in probe_entry_options(driver, county, market, product, entry_options):
         try:
             set_entry_limit(driver, entry_limit)  # Adjust page entries
             apply_filters(driver, county, market, product)  # Apply filters for county, market, product
@@ -938,21 +1655,49 @@ def scrape_with_dynamic_entries(driver, county, market, product, date_range):
             df = scrape_current_table(driver)
 
             # Filter data by the required date range
-            filtered_df = filter_data_by_date(df, date_range)
+            filtered_df = filter_data_by_date(df, bounds)
 
             # If filtered data covers the required range, return it
             if verify_month_coverage(filtered_df, date_range):
+                store_cached(filtered_df, county, market, product, date_range)
                 return filtered_df
         except Exception as e:
             print(f"Failed at entry limit {entry_limit}: {e}")
     return None  # Return None if no data is captured
 
+def probe_entry_options(driver, county, market, product, entry_options):
+    """
+    Order entry limits so the first one tried is the smallest that shows every row.
+    
+    Reads the total from the "Showing 1 to 10 of N entries" summary of a 10-row
+    probe; falls back to trying the largest limits first if it can't be read.
+    """
+    try:
+        set_entry_limit(driver, entry_options[0])
+        apply_filters(driver, county, market, product)
+        info = driver.find_element(By.CSS_SELECTOR, ".dataTables_info").text
+        total = int(re.search(r'of ([\d,]+) entries', info).group(1).replace(',', ''))
+    except Exception as e:
+        print(f"Could not read entry count, trying largest limits first: {e}")
+        return sorted(entry_options, reverse=True)
+    
+    fitting = [limit for limit in entry_options if limit >= total]
+    return fitting[:1] + sorted(set(entry_options) - set(fitting[:1]), reverse=True)
+
 def set_entry_limit(driver, entry_limit):
-    """Set the number of entries displayed per page."""
-    dropdown = driver.find_element(By.CSS_SELECTOR, "selector-for-entries-dropdown")
-    dropdown.click()
-    option = driver.find_element(By.XPATH, f"//option[text()='{entry_limit}']")
-    option.click()
+    """Set the number of entries displayed per page, reading and picking the option in one JS call."""
+    found = driver.execute_script("""
+        const select = document.querySelector('.dataTables_length select');
+        if (!select) return false;
+        const option = [...select.options].find(o => o.text.trim() === arguments[0]);
+        if (!option) return false;
+        select.value = option.value;
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+        if (window.jQuery) jQuery(select).trigger('change');
+        return true;
+    """, str(entry_limit))
+    if not found:
+        raise ValueError(f"No '{entry_limit}' option in the entries dropdown")
 
 def apply_filters(driver, county, market, product):
     """Apply filters for county, market, and product."""
@@ -962,27 +1707,34 @@ def apply_filters(driver, county, market, product):
 
 def scrape_current_table(driver):
     """Scrape the current table on the page into a DataFrame."""
-    table = driver.find_element(By.CSS_SELECTOR, "selector-for-table")
-    rows = table.find_elements(By.TAG_NAME, "tr")
-    data = []
-    for row in rows:
-        cells = row.find_elements(By.TAG_NAME, "td")
-        data.append([cell.text for cell in cells])
-    return pd.DataFrame(data, columns=["Market", "Product", "Low Price", "High Price", "County", "Date"])
-
-def filter_data_by_date(df, date_range):
-    """Filter DataFrame rows to include only dates within the range."""
-    start_date, end_date = date_range
-    df['Date'] = pd.to_datetime(df['Date'])
-    return df[(df['Date'] >= pd.to_datetime(start_date)) & (df['Date'] <= pd.to_datetime(end_date))]
+    # One page_source fetch and a C-level parse instead of one round-trip per cell
+    tree = lxml.html.fromstring(driver.page_source)
+    rows = tree.xpath("//table[contains(@class,'table-bordered')]//tbody/tr")
+    df = pd.DataFrame(
+        [[cell.text_content().strip() for cell in row.xpath("./td")] for row in rows],
+        columns=["Market", "Product", "Low Price", "High Price", "County", "Date"]
+    )
+    df["Date"] = pd.to_datetime(df["Date"], format="%Y-%m-%d", cache=True)
+    return df
+
+def filter_data_by_date(df, bounds):
+    """Filter DataFrame rows to include only dates within the (start, end) Timestamp bounds."""
+    start_ts, end_ts = bounds
+    return df.loc[(df['Date'] >= start_ts) & (df['Date'] <= end_ts)]
 
 def verify_month_coverage(df, date_range):
     """Verify that the DataFrame covers at least one full month in the range."""
     if df.empty:
         return False
-    start_date, end_date = pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1])
-    months_covered = df['Date'].dt.to_period('M').unique()
-    return all(pd.date_range(start_date, end_date, freq='M').to_period('M').isin(months_covered))
+    required = required_months(*date_range)
+    return required.issubset(df['Date'].dt.to_period('M').unique())
+
+@functools.lru_cache(maxsize=None)
+def required_months(start_date, end_date):
+    """Full calendar months between two date strings, computed once per range."""
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    # Only months whose last day falls in the range count as full months
+    return frozenset(pd.date_range(start, end, freq='M').to_period('M'))
 
 def save_to_csv(df, filename):
     """Save the filtered data to a CSV file."""
@@ -995,7 +1747,15 @@ def save_to_csv(df, filename):
 def initialize_driver():
     """Initialize Selenium WebDriver."""
     options = webdriver.ChromeOptions()
-    options.add_argument("--headless")  # Run in headless mode (optional)
+    options.add_argument("--headless=new")  # Run in headless mode (optional)
+    options.add_argument("--disable-dev-shm-usage")
+    # Only the results table is scraped, so skip images and notifications
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    options.page_load_strategy = "eager"  # Return at DOMContentLoaded
     driver = webdriver.Chrome(options=options)
     return driver
 
@@ -1003,20 +1763,102 @@ def initialize_driver():
 start_date, end_date = compute_date_range(months_back=6)
 date_range = (start_date, end_date)
 
-# Initialize the driver
-driver = initialize_driver()
+class BrowserPool:
+    """
+    Pre-started browsers lent to one job at a time and restarted after max_uses_per_browser jobs.
 
-# Example of what can be looped over
-counties = ["Nairobi"]
-markets = ["Nyamakima"]
-products = ["Dry Maize"]
+    Between jobs a browser is wiped back to a clean session (cookies, web storage)
+    rather than relaunched, so each job starts isolated without paying for a new Chrome.
+    """
 
-for county in counties:
-    for market in markets:
-        for product in products:
-            fresh_data = scrape_with_dynamic_entries(driver, county, market, product, date_range)
-            if fresh_data is not None:
-                save_to_csv(fresh_data, f"{county}_{market}_{product}.csv")
+    def __init__(self, size, max_uses_per_browser=50):
+        self.max_uses_per_browser = max_uses_per_browser
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        for _ in range(size):
+            self._idle.put(self._start())
+
+    def _start(self):
+        driver = initialize_driver()
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+
+    def _stop(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
 
-# Quit driver after the scraping is done
-driver.quit()
+    def acquire(self):
+        """Wait for an idle browser and lend it out, starting one if its slot is empty."""
+        driver = self._idle.get()
+        if driver is None:
+            try:
+                driver = self._start()
+            except Exception:
+                self._idle.put(None)  # Keep the slot so the next acquire tries again
+                raise
+        return driver
+
+    def release(self, driver):
+        """Reset a browser for the next job, or replace it once it has been used enough."""
+        with self._lock:
+            self._uses[driver] += 1
+            worn_out = self._uses[driver] >= self.max_uses_per_browser
+        if not worn_out:
+            try:
+                # Storage belongs to the page's origin, so clear it before leaving the site
+                driver.execute_script(
+                    "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except WebDriverException:
+                worn_out = True
+        if worn_out:
+            self._stop(driver)
+            try:
+                driver = self._start()
+            except Exception as e:
+                # An empty slot instead of a lost one; acquire() starts the browser later
+                print(f"Could not restart browser, will retry on next use: {e}")
+                driver = None
+        self._idle.put(driver)
+
+    def close(self):
+        """Quit every browser in the pool."""
+        with self._lock:
+            drivers = list(self._uses)
+        for driver in drivers:
+            self._stop(driver)
+
+# Pre-warmed browsers shared by the worker threads
+MAX_CONCURRENCY = 5
+
+def scrape_one(pool, county, market, product):
+    """Scrape and save a single combination on a browser borrowed from the pool."""
+    driver = pool.acquire()
+    try:
+        fresh_data = scrape_with_dynamic_entries(driver, county, market, product, date_range)
+    finally:
+        pool.release(driver)
+    if fresh_data is not None:
+        save_to_csv(fresh_data, f"{county}_{market}_{product}.csv")
+
+def scrape_with_pool(combinations):
+    """Scrape (county, market, product) combinations on a pool of pre-started browsers."""
+    pool_size = min(MAX_CONCURRENCY, len(combinations))
+    browser_pool = BrowserPool(pool_size)
+    try:
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            for future in [executor.submit(scrape_one, browser_pool, *combo) for combo in combinations]:
+                future.result()
+    finally:
+        # Quit every driver after the scraping is done
+        browser_pool.close()
+
+if __name__ == "__main__":
+    main()
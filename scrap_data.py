@@ -1,27 +1,123 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, WebDriverException, StaleElementReferenceException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.keys import Keys
 import functools
+import hashlib
 import socket
 import ssl
 from urllib3.exceptions import MaxRetryError, NewConnectionError
-from requests.exceptions import ConnectionError, Timeout
-from dateutil.relativedelta import relativedelta
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout, RequestException
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+import io
+import lxml.html
+import queue
+import threading
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import shutil
 import time
 import logging
 import json
 import os
+import random
 import re
+from pathlib import Path
 from typing import Optional, Dict, List, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# Matches the DataTables summary, e.g. "Showing 1 to 10 of 1,250 entries"
+_ENTRIES_RE = re.compile(r'of\s+([\d,]+)\s+entries')
+_DATE_FMT = "%Y-%m-%d"
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD string; cached since the same few dates are validated repeatedly."""
+    return datetime.strptime(date_str, _DATE_FMT)
+
+
+# Markers of a bot-challenge or access-denied page served in place of the results
+_CHALLENGE_RE = re.compile(r'cf-challenge|captcha|access denied|attention required', re.IGNORECASE)
+
+# Low-cardinality text columns of the results table and the tags added by run_all
+_CATEGORY_COLUMNS = ['Commodity', 'Classification', 'Grade', 'Sex', 'Market', 'County', 'Product']
+
+
+def _apply_column_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Store repeated text as category and parse dates; prices stay float64 so they keep their exact values."""
+    df = df.astype({col: 'category' for col in _CATEGORY_COLUMNS
+                    if col in df.columns and df[col].dtype == object})
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'], format=_DATE_FMT, errors='coerce', cache=True)
+    return df
+
+
+def _tag_frame(df: pd.DataFrame, county: str, market: str, product: str) -> pd.DataFrame:
+    """Add County/Market/Product as single-category columns, skipping repeated-string arrays."""
+    codes = np.zeros(len(df), dtype=np.int8)
+    return df.assign(**{
+        column: pd.Categorical.from_codes(codes, [value])
+        for column, value in (('County', county), ('Market', market), ('Product', product))
+    })
+
+
+def _merge_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """
+    Union of the given schemas' columns, in first-seen order.
+    
+    Categories are decoded to their value type, since each part has its own dictionary.
+    A column whose inferred type differs between parts is widened: mixed integer and
+    float columns become float64, and any other mix becomes string.
+    """
+    seen: Dict[str, set] = {}
+    for schema in schemas:
+        for field in schema:
+            value_type = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+            types = seen.setdefault(field.name, set())
+            if not pa.types.is_null(value_type):  # All-null parts take any type
+                types.add(value_type)
+    fields = []
+    for name, types in seen.items():
+        if not types:
+            field_type = pa.null()
+        elif len(types) == 1:
+            field_type = next(iter(types))
+        elif all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+            field_type = pa.float64()
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(name, field_type))
+    return pa.schema(fields)
+
+
+def _read_results_table(html: str) -> Optional[pd.DataFrame]:
+    """Parse the first table whose class list includes table-bordered, or None if there is none."""
+    tables = lxml.html.fromstring(html).xpath(
+        "//table[contains(concat(' ', normalize-space(@class), ' '), ' table-bordered ')]"
+    )
+    if not tables:
+        return None
+    return pd.read_html(
+        io.StringIO(lxml.html.tostring(tables[0], encoding='unicode')), flavor='lxml'
+    )[0]
+
+
+def _parse_table_html(html: str) -> pd.DataFrame:
+    """Parse one page of table markup."""
+    return pd.read_html(io.StringIO(html), flavor='lxml')[0]
+
 
 class AMISScraper:
     """Enhanced Agricultural Market Information System (AMIS) scraper with improved reliability."""
@@ -35,6 +131,38 @@ class AMISScraper:
     
     MAX_ENTRIES = 3
     BATCH_SIZE = 1000 # Number of rows to process at once for memory efficiency
+    HTTP_CONCURRENCY = 8 # Simultaneous search form posts during the HTTP pass
+    MAX_BROWSERS = 5 # Upper bound on headless browsers in a parallel run
+    DRIVER_RECYCLE_EVERY = 50 # Browser scrapes before Chrome is restarted to bound its memory growth
+    COMMAND_POOL_SIZE = 20 # Keep-alive connections to chromedriver
+    PROGRESS_FLUSH_EVERY = 10 # Progress entries written per batch
+    PROGRESS_FLUSH_INTERVAL = 1.0 # Seconds before a partial batch is written anyway
+    CACHE_TTL = 24 * 3600 # Seconds a cached scrape is reused before fetching it again
+    
+    # Requests never needed for scraping the results table: static assets and third-party trackers
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.woff*", "*.ttf", "*.css",
+        "*analytics*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+        "*facebook.com/tr*", "*hotjar.com*", "*addthis.com*", "*sharethis.com*",
+        "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*maps.googleapis.com*"
+    ]
+    
+    # chromedriver path, resolved once per process
+    _driver_path: Optional[str] = None
+    
+    # Page locators, and the wait conditions built from them once rather than per call
+    _TABLE_CSS = (By.CSS_SELECTOR, "table")
+    _ROW_CSS = (By.CSS_SELECTOR, "table tbody tr")
+    _TBODY_CSS = (By.CSS_SELECTOR, "table tbody")
+    _NEXT_CSS = (By.CSS_SELECTOR, ".pagination .next")
+    _FORM_CSS = (By.CSS_SELECTOR, "#page-content select[name='county[]']")
+    _TABLE_PRESENT = EC.presence_of_element_located(_TABLE_CSS)
+    _ROW_PRESENT = EC.presence_of_element_located(_ROW_CSS)
+    _TBODY_PRESENT = EC.presence_of_element_located(_TBODY_CSS)
+    _FORM_PRESENT = EC.presence_of_element_located(_FORM_CSS)
+    
+    # Selects whose options are reloaded when the select before them changes
+    _CASCADING_SELECTS = ("market[]", "product[]")
     
     """
     A scraper for the Agricultural Market Information System (AMIS) website.
@@ -66,7 +194,8 @@ class AMISScraper:
         self.dirs = {
             'exports': os.path.join(self.base_dir, 'exports'),
             'logs': os.path.join(self.base_dir, 'logs'),
-            'progress': os.path.join(self.base_dir, 'progress')
+            'progress': os.path.join(self.base_dir, 'progress'),
+            'cache': os.path.join(self.base_dir, 'cache')
         }
         self._setup_directories()
         
@@ -77,11 +206,41 @@ class AMISScraper:
         # Initialize webdriver with enhanced options
         self.driver = self._initialize_webdriver(headless)
         self.wait = WebDriverWait(self.driver, timeout)
+        self.fast_wait = self._make_fast_wait()
+        self._driver_uses = 0
         
         # Load or initialize progress tracking
-        self.progress_file = os.path.join(self.dirs['progress'], 'scraping_progress.json')
+        progress_dir = Path(self.dirs['progress'])
+        self.progress_file = progress_dir / 'scraping_progress.json'
+        self.progress_log = progress_dir / 'scraping_progress.jsonl'
         self.progress = self._load_progress()
         
+        # Append-only progress log, written in batches by a background thread
+        self._progress_fp = self.progress_log.open('a')
+        self._progress_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._progress_thread = threading.Thread(target=self._write_progress, daemon=True)
+        self._progress_thread.start()
+        
+        # HTTP session for submitting the search form without the browser
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._search_form = None
+        self._option_cache: Dict[str, Dict[str, str]] = {}
+        self._http_blocked = threading.Event()  # Set once the site starts refusing plain HTTP
+        
+        # Filters shown on the current page after the last successful search
+        self._last_filters: Dict[str, str] = {}
+        
+        # Results table and next button of the current page, dropped when the page changes
+        self._table = None
+        self._next_button = None
+        
     def _setup_directories(self):
         """Create necessary directories if they don't exist."""
         for directory in self.dirs.values():
@@ -90,6 +249,8 @@ class AMISScraper:
     def _setup_logger(self) -> logging.Logger:
         """Configure enhanced logging with file and console output."""
         logger = logging.getLogger('AMISScraper')
+        if logger.handlers:
+            return logger  # Already configured by another scraper in this process
         logger.setLevel(logging.INFO)
         
         # File handler
@@ -118,7 +279,7 @@ class AMISScraper:
         """Initialize Chrome WebDriver with enhanced options."""
         chrome_options = Options()
         if headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
         
         # Performance and stability options
         chrome_options.add_argument("--disable-gpu")
@@ -133,55 +294,180 @@ class AMISScraper:
         # Memory management options
         chrome_options.add_argument("--memory-pressure-off")
         chrome_options.add_argument("--disk-cache-size=1")
+        chrome_options.add_argument(
+            "--disable-features=Translate,BackForwardCache,InterestFeedContentSuggestions,"
+            "OptimizationHints,MediaRouter,DialMediaRouteProvider"
+        )
+        chrome_options.add_argument("--renderer-process-limit=2")
+        chrome_options.add_argument("--js-flags=--max-old-space-size=512")
+        
+        # Images, stylesheets, fonts and media are never scraped, so don't download them
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.media_stream": 2
+        })
+        
+        # Return from driver.get() at DOMContentLoaded; callers wait for the elements they need
+        chrome_options.page_load_strategy = 'eager'
         
-        return webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
+        # ChromeDriverManager().install() checks disk and network, so only run it once.
+        # A preinstalled binary (e.g. in a container image) can be given via CHROMEDRIVER_PATH.
+        if AMISScraper._driver_path is None:
+            AMISScraper._driver_path = (
+                os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+            )
+        
+        driver = webdriver.Chrome(
+            service=Service(AMISScraper._driver_path),
+            options=chrome_options,
+            keep_alive=True
         )
+        # Only explicit waits are used; an implicit wait would be added on top of each one
+        driver.implicitly_wait(0)
+        self._enlarge_command_pool(driver)
+        self._block_unneeded_requests(driver)
+        return driver
+
+    def _block_unneeded_requests(self, driver: webdriver.Chrome):
+        """Block images, fonts, stylesheets and analytics at the network layer via CDP."""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            self.logger.debug(f"Could not set blocked URLs: {str(e)}")
+
+    def _enlarge_command_pool(self, driver: webdriver.Chrome):
+        """Replace the single-connection chromedriver pool with a larger keep-alive pool."""
+        try:
+            executor = driver.command_executor
+            pool_kwargs = dict(getattr(executor._conn, 'connection_pool_kw', {}))
+            # chromedriver is local, so a failed command is surfaced rather than retried by urllib3
+            pool_kwargs.update(maxsize=self.COMMAND_POOL_SIZE, block=False, retries=False)
+            executor._conn = urllib3.PoolManager(num_pools=1, **pool_kwargs)
+        except AttributeError as e:
+            self.logger.debug(f"Could not resize WebDriver connection pool: {str(e)}")
     
     def _load_progress(self) -> Dict:
-        """Load or initialize progress tracking."""
-        if os.path.exists(self.progress_file):
-            try:
-                with open(self.progress_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                self.logger.warning("Could not load progress file, starting fresh")
-        return {
+        """Load progress from the legacy JSON file, then replay the append-only log."""
+        progress = {
             'last_county': None,
             'last_market': None,
             'last_product': None,
             'completed': [],
             'timestamp': None
         }
+        if self.progress_file.exists():
+            try:
+                with self.progress_file.open('r') as f:
+                    progress = json.load(f)
+            except json.JSONDecodeError:
+                self.logger.warning("Could not load progress file, starting fresh")
+        
+        if self.progress_log.exists():
+            with self.progress_log.open('r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        self.logger.warning("Skipping truncated progress log line")
+                        continue
+                    progress.update({
+                        'last_county': entry['c'],
+                        'last_market': entry['m'],
+                        'last_product': entry['p'],
+                        'timestamp': entry['t']
+                    })
+                    progress['completed'].append({
+                        'county': entry['c'],
+                        'market': entry['m'],
+                        'product': entry['p'],
+                        'timestamp': entry['t']
+                    })
+        return progress
 
     def _save_progress(self, county: str, market: str, product: str):
-        """Save current scraping progress."""
+        """Record a completed combination in memory and append it to the progress log."""
+        timestamp = datetime.now().isoformat()
         self.progress.update({
             'last_county': county,
             'last_market': market,
             'last_product': product,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         })
         self.progress['completed'].append({
             'county': county,
             'market': market,
             'product': product,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         })
         
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+        self._progress_queue.put(
+            json.dumps({'c': county, 'm': market, 'p': product, 't': timestamp}) + '\n'
+        )
+
+    def _write_progress(self):
+        """Drain the progress queue, writing up to PROGRESS_FLUSH_EVERY lines per flush."""
+        done = False
+        while not done:
+            lines = []
+            try:
+                deadline = time.monotonic() + self.PROGRESS_FLUSH_INTERVAL
+                while len(lines) < self.PROGRESS_FLUSH_EVERY:
+                    line = self._progress_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    if line is None:  # Sentinel from quit_driver
+                        done = True
+                        break
+                    lines.append(line)
+            except queue.Empty:
+                pass
+            if lines:
+                self._progress_fp.write(''.join(lines))
+                self._progress_fp.flush()
+
+    def _cache_path(self, county: str, market: str, product: str,
+                    start_date: str, end_date: str) -> str:
+        """Location of the cached scrape for one combination and date range."""
+        key = hashlib.md5(f"{county}|{market}|{product}|{start_date}|{end_date}".encode()).hexdigest()
+        return os.path.join(self.dirs['cache'], f"{key}.parquet")
+
+    def _load_cached(self, county: str, market: str, product: str,
+                     start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """Return a cached scrape if one exists and is younger than CACHE_TTL."""
+        path = self._cache_path(county, market, product, start_date, end_date)
+        try:
+            if time.time() - os.path.getmtime(path) < self.CACHE_TTL:
+                return pd.read_parquet(path)
+        except OSError:
+            pass  # Not cached
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache file {path}: {str(e)}")
+        return None
+
+    def _store_cached(self, df: pd.DataFrame, county: str, market: str, product: str,
+                      start_date: str, end_date: str):
+        """Write a scrape to the cache, via a temporary file so readers never see a partial one."""
+        path = self._cache_path(county, market, product, start_date, end_date)
+        try:
+            df.to_parquet(path + ".tmp", index=False)
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            self.logger.warning(f"Could not cache scrape of {county}, {market}, {product}: {str(e)}")
 
     def _get_total_entries(self) -> Optional[int]:
         """Get total number of entries available from the page."""
         try:
-            info_text = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "selPerPage"))
-            ).text
-            match = re.search(r'of (\d+) entries', info_text)
+            # DataTables summary, e.g. "Showing 1 to 10 of 1,250 entries"
+            info_text = self.wait.until(lambda d: d.execute_script(
+                "var info = document.querySelector('#marketTable_info, .dataTables_info');"
+                "return info ? info.innerText : null;"
+            ))
+            match = _ENTRIES_RE.search(info_text)
             if match:
-                return int(match.group(1))
+                return int(match.group(1).replace(',', ''))
             return None
         except Exception as e:
             self.logger.error(f"Error getting total entries: {str(e)}")
@@ -191,11 +477,12 @@ class AMISScraper:
         """Choose optimal entries per page based on total available."""
         if not total_entries:
             return self.entry_options[0]
-            
-        for entry_option in reversed(self.entry_options):
-            if entry_option <= total_entries:
+        
+        # Smallest page size that shows everything on one page
+        for entry_option in self.entry_options:
+            if entry_option >= total_entries:
                 return entry_option
-        return self.entry_options[0]
+        return self.entry_options[-1]
     
     def _verify_data_completeness(self, df: pd.DataFrame, expected_count: int) -> bool:
         """Verify scraped data matches expected count."""
@@ -217,7 +504,6 @@ class AMISScraper:
         try:
             self.driver.delete_all_cookies()
             self.driver.refresh()
-            time.sleep(self.DELAYS['after_page_load'])
             self._wait_for_page_load()
         except Exception as e:
             self.logger.error(f"Error refreshing session: {str(e)}")
@@ -232,21 +518,36 @@ class AMISScraper:
         finally:
             self.driver = self._initialize_webdriver(True)  # Reinitialize in headless mode
             self.wait = WebDriverWait(self.driver, self.timeout)
+            self.fast_wait = self._make_fast_wait()
+            self._driver_uses = 0
+            self._table = None
+            self._next_button = None
+
+    def _make_fast_wait(self) -> WebDriverWait:
+        """Short, finely polled wait for UI actions that normally finish in well under a second."""
+        return WebDriverWait(
+            self.driver, 5, poll_frequency=0.1,
+            ignored_exceptions=(StaleElementReferenceException,)
+        )
 
-    def _wait_for_page_load(self):
-        """Wait for page to be fully loaded."""
+    def _release_driver(self):
+        """Reset the browser for the next scrape, restarting it every DRIVER_RECYCLE_EVERY uses."""
+        self._driver_uses += 1
+        if self._driver_uses >= self.DRIVER_RECYCLE_EVERY:
+            self.logger.info(f"Recycling WebDriver after {self._driver_uses} scrapes")
+            self._reinitialize_driver()
+            return
         try:
-            self.wait.until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            self.logger.info("Page loaded successfully")
-        except TimeoutException:
-            self.logger.error("Timeout waiting for page to load")
-            raise
+            # Cookies are kept so the next search can reuse the session and the filters on the page
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        except WebDriverException as e:
+            self.logger.debug(f"Could not reset browser state: {str(e)}")
 
     def _set_select_value(self, name: str, value: str, max_retries: int = 3, retry_delay: float = 5.0) -> bool:
         """
-        Set value in a select element with improved handling and retry mechanism.
+        Set value in a select element with a single JavaScript call and retry mechanism.
+        
+        The option is matched by exact visible text first, then case-insensitively.
         
         :param name: Name attribute of the select element
         :param value: Value to be selected
@@ -254,54 +555,48 @@ class AMISScraper:
         :param retry_delay: Delay between retry attempts
         :return: Boolean indicating successful selection
         """
+        js_script = """
+        var select = document.querySelector("select[name='" + arguments[0] + "']");
+        if (!select || select.options.length <= 1) {
+            return {loaded: false, matched: null};
+        }
+        var wanted = arguments[1].trim();
+        var wantedLower = wanted.toLowerCase();
+        var index = -1;
+        for (var i = 0; i < select.options.length; i++) {
+            var text = select.options[i].text.trim();
+            if (text === wanted) {
+                index = i;
+                break;
+            }
+            if (index < 0 && text.toLowerCase() === wantedLower) {
+                index = i;
+            }
+        }
+        if (index < 0) {
+            return {loaded: true, matched: null};
+        }
+        select.selectedIndex = index;
+        select.dispatchEvent(new Event('change', { bubbles: true }));
+        return {loaded: true, matched: select.options[index].text.trim()};
+        """
         for attempt in range(max_retries):
             try:
                 self.logger.info(f"Attempt {attempt + 1} to set {name} to {value}")
                 
-                # Handle array-style names in CSS selector
-                escaped_name = name.replace("[]", "\\[\\]")
-                selector = f"select[name='{escaped_name}']"
-                
-                # Wait for select element with retry on StaleElementReferenceException
-                select_element = None
-                for _ in range(3):
-                    try:
-                        select_element = self.wait.until(
-                            lambda d: d.find_element(By.CSS_SELECTOR, selector)
-                        )
-                        break
-                    except StaleElementReferenceException:
-                        self.logger.debug(f"Stale element encountered for {name}, retrying...")
-                        time.sleep(1)
-                        continue
-                
-                if not select_element:
-                    raise NoSuchElementException(f"Could not locate stable select element for {name}")
-                
-                # Scroll element into view
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", select_element)
-                time.sleep(1)
-                
-                # Wait for options to be present and verify they're loaded
-                options = select_element.find_elements(By.CSS_SELECTOR, "option")
-                if len(options) <= 1:
-                    self.logger.warning(f"Insufficient options found for {name}, retrying...")
-                    time.sleep(retry_delay)
-                    continue
-
-                # Try selection methods
-                select = Select(select_element)
-                if self._select_by_visible_text(select, value):
-                    return True
-                if self._select_by_js(self.driver, select_element, value):
-                    return True
-                if self._select_by_case_insensitive(select, value):
+                result = self.driver.execute_script(js_script, name, value)
+                if result['matched'] is not None:
+                    self.logger.info(f"Successfully selected '{result['matched']}' for {name}")
                     return True
-                    
-                self.logger.warning(f"Attempt {attempt + 1} failed. Retrying...")
+                if result['loaded']:
+                    self.logger.error(f"Option '{value}' not found for {name}")
+                    return False
+                
+                # Options are still loading (e.g. markets for the chosen county)
+                self.logger.warning(f"Insufficient options found for {name}, retrying...")
                 time.sleep(retry_delay)
 
-            except (NoSuchElementException, WebDriverException) as e:
+            except WebDriverException as e:
                 self.logger.error(f"WebDriver error on attempt {attempt + 1}: {str(e)}")
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
@@ -314,78 +609,6 @@ class AMISScraper:
         self.logger.error(f"Failed to set {name} to {value} after {max_retries} attempts")
         return False
 
-    def _select_by_visible_text(self, select: Select, value: str) -> bool:
-        """
-        Attempt to select an option by exact visible text.
-        
-        :param select: Selenium Select object
-        :param value: Value to select
-        :return: Boolean indicating successful selection
-        """
-        try:
-            select.select_by_visible_text(value)
-            if select.first_selected_option.text.strip() == value:
-                self.logger.info(f"Successfully selected {value} by visible text")
-                return True
-        except Exception as e:
-            self.logger.debug(f"Selection by visible text failed: {str(e)}")
-        return False
-
-    def _select_by_js(self, driver, select_element, value: str) -> bool:
-        """
-        Attempt to select an option using JavaScript.
-        
-        :param driver: Selenium WebDriver
-        :param select_element: WebElement of the select
-        :param value: Value to select
-        :return: Boolean indicating successful selection
-        """
-        try:
-            js_script = """
-            var select = arguments[0];
-            var value = arguments[1];
-            var options = select.options;
-            for (var i = 0; i < options.length; i++) {
-                if (options[i].text.trim() === value) {
-                    select.selectedIndex = i;
-                    select.dispatchEvent(new Event('change', { bubbles: true }));
-                    return true;
-                }
-            }
-            return false;
-            """
-            result = driver.execute_script(js_script, select_element, value)
-            if result:
-                self.logger.info(f"Successfully selected '{value}' using JavaScript")
-                return True
-            else:
-                self.logger.warning(f"Option '{value}' not found in select via JS")
-        except Exception as e:
-            self.logger.debug(f"JavaScript selection failed for '{value}': {str(e)}")
-        return False
-
-    def _select_by_case_insensitive(self, select: Select, value: str) -> bool:
-        """
-        Attempt to select an option using case-insensitive matching.
-        
-        :param select: Selenium Select object
-        :param value: Value to select
-        :return: Boolean indicating successful selection
-        """
-        try:
-            value_lower = value.strip().lower()  # Normalize the value to lower case
-            for option in select.options:
-                option_text = option.text.strip()
-                if option_text.lower() == value_lower:
-                    select.select_by_visible_text(option.text)
-                    if select.first_selected_option.text.strip().lower() == value_lower:
-                        self.logger.info(f"Successfully selected '{value}' (case-insensitive match)")
-                        return True
-            self.logger.warning(f"Option '{value}' not found in select (case-insensitive match)")
-        except Exception as e:
-            self.logger.debug(f"Case-insensitive selection failed for '{value}': {str(e)}")
-        return False
-
     def _set_date_in_calendar(self, date_str: str, field_id: str) -> bool:
         """
         Set a specific date in the Zebra DatePicker widget.
@@ -399,21 +622,23 @@ class AMISScraper:
         """
         try:
             # Parse the target date
-            target_date = datetime.strptime(date_str, "%Y-%m-%d")
+            target_date = _parse_date(date_str)
             self.logger.info(f"Setting date to: {target_date.strftime('%Y-%m-%d')}")
 
+            # Fast path: set the value in one script call instead of clicking through months
+            if self._set_date_via_js(target_date.strftime("%Y-%m-%d"), field_id):
+                return True
+
             # Locate and click the input field to open the date picker
             date_input = self.wait.until(
                 EC.presence_of_element_located((By.ID, field_id))
             )
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", date_input)
-            time.sleep(0.5)
+            self._scroll_into_view_if_needed(date_input)
             date_input.click()
-            time.sleep(1)  # Wait for date picker to open
 
-            # Locate the active date picker
-            datepicker = self.wait.until(
-                EC.presence_of_element_located((
+            # Wait for the date picker to open
+            datepicker = self.fast_wait.until(
+                EC.visibility_of_element_located((
                     By.CSS_SELECTOR, 
                     "div.Zebra_DatePicker:not(.dp_hidden)"
                 ))
@@ -466,7 +691,13 @@ class AMISScraper:
                             self.logger.info(f"Reached target month/year: {target_date.strftime('%B, %Y')}")
                             return  # Reached the target month/year
 
-                        time.sleep(0.75)  # Increased sleep time to account for page load
+                        # Wait for the caption to move on rather than sleeping
+                        previous_caption = caption.text
+                        self.fast_wait.until(
+                            lambda d: datepicker.find_element(
+                                By.CSS_SELECTOR, "table.dp_header td.dp_caption"
+                            ).text != previous_caption
+                        )
                         attempts += 1
 
                     except Exception as e:
@@ -489,14 +720,16 @@ class AMISScraper:
             for day in days:
                 if day.text.strip() == target_day_str:
                     self.logger.info(f"Selecting day: {target_day_str}")
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", day)
-                    time.sleep(0.5)
+                    self._scroll_into_view_if_needed(day)
                     day.click()
-                    time.sleep(0.5)
 
                     # Validate that the date was set correctly
-                    actual_value = date_input.get_attribute("value")
                     expected_value = target_date.strftime("%Y-%m-%d")
+                    try:
+                        self.fast_wait.until(lambda d: date_input.get_attribute("value") == expected_value)
+                    except TimeoutException:
+                        pass
+                    actual_value = date_input.get_attribute("value")
                     if actual_value == expected_value:
                         self.logger.info(f"Date set successfully: {expected_value}")
                         return True
@@ -511,6 +744,48 @@ class AMISScraper:
             self.logger.error(f"Error setting date: {str(e)}")
             return False
 
+    def _scroll_into_view_if_needed(self, element):
+        """Scroll an element to the viewport centre only if it is off-screen, then wait until clickable."""
+        scrolled = self.driver.execute_script("""
+        var el = arguments[0];
+        var r = el.getBoundingClientRect();
+        if (r.top >= 0 && r.bottom <= window.innerHeight) {
+            return false;
+        }
+        el.scrollIntoView({block: 'center', behavior: 'instant'});
+        return true;
+        """, element)
+        if scrolled:
+            self.fast_wait.until(EC.element_to_be_clickable(element))
+
+    def _set_date_via_js(self, date_str: str, field_id: str) -> bool:
+        """Write the date into the input (via Zebra's set_date when available) and fire change."""
+        js_script = """
+        var input = document.getElementById(arguments[0]);
+        if (!input) {
+            return null;
+        }
+        var picker = window.jQuery && jQuery(input).data('Zebra_DatePicker');
+        if (picker && picker.set_date) {
+            picker.set_date(arguments[1]);
+        } else {
+            input.value = arguments[1];
+        }
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+        input.dispatchEvent(new Event('blur'));
+        return input.value;
+        """
+        try:
+            actual_value = self.driver.execute_script(js_script, field_id, date_str)
+            if actual_value == date_str:
+                self.logger.info(f"Date set successfully via JavaScript: {date_str}")
+                return True
+            self.logger.debug(f"JavaScript date entry left {field_id} as {actual_value}")
+        except Exception as e:
+            self.logger.debug(f"JavaScript date entry failed for '{date_str}': {str(e)}")
+        return False
+
     def _wait_for_datepicker_update(self) -> bool:
         """Helper method to wait for date picker updates to complete."""
         try:
@@ -544,8 +819,6 @@ class AMISScraper:
                 if not self._retry_set_date_in_calendar(start_date, "dateStartSearch", max_retries):
                     return False
                 
-                time.sleep(1)  # Wait between setting dates
-                
                 # Set end date
                 if not self._retry_set_date_in_calendar(end_date, "dateEndSearch", max_retries):
                     return False
@@ -558,8 +831,8 @@ class AMISScraper:
                 actual_end = end_elem.get_attribute("value")
                 
                 # Convert dates to consistent format for comparison
-                expected_start = datetime.strptime(start_date, "%Y-%m-%d").strftime("%Y-%m-%d")
-                expected_end = datetime.strptime(end_date, "%Y-%m-%d").strftime("%Y-%m-%d")
+                expected_start = _parse_date(start_date).strftime(_DATE_FMT)
+                expected_end = _parse_date(end_date).strftime(_DATE_FMT)
                 
                 if actual_start == expected_start and actual_end == expected_end:
                     self.logger.info("Dates set and verified successfully")
@@ -581,56 +854,126 @@ class AMISScraper:
 
     def set_filters(self, county: str, market: str, product: str, 
                     start_date: str, end_date: str, entries: str = "100") -> bool:
-        """Set search filters with improved error handling and sequence."""
+        """
+        Set search filters with improved error handling and sequence.
+        
+        Only the filters that differ from the last successful search are changed; the
+        page is reloaded only when it no longer shows that search's filters.
+        """
         try:
             self.logger.info(f"Setting filters for {product} in {market}, {county}")
-            self.driver.get(self.url)
-
-            # Wait for initial page load
-            self._wait_for_page_load()
-
-            # Set filters in sequence with proper delays
-            filter_sequence = [
-                ("county[]", county, 5),
-                ("market[]", market, 3),
-                ("product[]", product, 2),
-                ("per_page", entries, 2)
-            ]
+            wanted = {
+                "county[]": county,
+                "market[]": market,
+                "product[]": product,
+                "per_page": entries,
+                "start": start_date,
+                "end": end_date
+            }
+            last_filters = self._last_filters if self._filters_still_shown() else {}
+            self._last_filters = {}  # Unknown until this search succeeds
+            
+            if not last_filters:
+                self.driver.get(self.url)
+
+                # Wait for initial page load
+                self._wait_for_page_load()
+
+            # Set filters in sequence with proper delays; changing a select
+            # reloads the options of the ones after it, so those are set again too
+            filter_sequence = []
+            for name, delay in (("county[]", 5), ("market[]", 3), ("product[]", 2), ("per_page", 2)):
+                if filter_sequence or last_filters.get(name) != wanted[name]:
+                    filter_sequence.append((name, wanted[name], delay))
             
             # Set filter values one by one
-            if not self._apply_filters_in_sequence(filter_sequence):
+            if filter_sequence and not self._apply_filters_in_sequence(filter_sequence):
                 return False
 
             # Set dates after all dropdowns
-            if not self._set_dates(start_date, end_date):
-                return False
+            if (last_filters.get("start"), last_filters.get("end")) != (start_date, end_date):
+                if not self._set_dates(start_date, end_date):
+                    return False
 
             # Click filter button with retry logic
-            return self._retry_click_filter_button()
+            if not self._retry_click_filter_button():
+                return False
+            self._last_filters = wanted
+            return True
 
         except Exception as e:
             self.logger.error(f"Error in set_filters: {str(e)}")
             return False
 
+    def _filters_still_shown(self) -> bool:
+        """Check in one call that the page still shows the last search's filters."""
+        if not self._last_filters:
+            return False
+        js_script = """
+        var shown = {};
+        ['county[]', 'market[]', 'product[]', 'per_page'].forEach(function(name) {
+            var s = document.querySelector("select[name='" + name + "']");
+            shown[name] = s && s.selectedIndex >= 0 ? s.options[s.selectedIndex].text.trim().toLowerCase() : null;
+        });
+        var start = document.getElementById('dateStartSearch');
+        var end = document.getElementById('dateEndSearch');
+        shown.start = start ? start.value : null;
+        shown.end = end ? end.value : null;
+        return shown;
+        """
+        try:
+            shown = self.driver.execute_script(js_script)
+        except WebDriverException:
+            return False
+        return all(
+            shown.get(name) == (value if name in ("start", "end") else value.strip().lower())
+            for name, value in self._last_filters.items()
+        )
+
     def _wait_for_page_load(self):
-        """Wait for the page to load completely by checking for specific element."""
+        """Wait for the search form rather than for every sub-resource to finish loading."""
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "page-content"))  # Adjust selector as necessary
-            )
+            WebDriverWait(self.driver, 10).until(self._FORM_PRESENT)
         except Exception as e:
             self.logger.error(f"Error while waiting for page load: {str(e)}")
             raise
 
     def _apply_filters_in_sequence(self, filter_sequence):
-        """Apply filter values in sequence."""
-        for name, value, delay in filter_sequence:
+        """Apply filter values in sequence, waiting up to each delay for the next select to repopulate."""
+        for index, (name, value, delay) in enumerate(filter_sequence):
+            next_name = filter_sequence[index + 1][0] if index + 1 < len(filter_sequence) else None
+            # A reused page still lists the previous county's markets, so wait for the list to change
+            previous = self._options_signature(next_name) if next_name in self._CASCADING_SELECTS else None
             if not self._set_select_value(name, value):
                 self.logger.error(f"Failed to set {name} to {value}")
                 return False
-            time.sleep(delay)
+            if next_name:
+                self._wait_for_options(next_name, previous, delay)
         return True
 
+    def _options_signature(self, name: str) -> Optional[str]:
+        """Values and labels of a select's options as one string, or None while it only has its placeholder."""
+        try:
+            return self.driver.execute_script(
+                "var s = document.querySelector(\"select[name='\" + arguments[0] + \"']\");"
+                "if (s === null || s.options.length <= 1) { return null; }"
+                "return Array.prototype.map.call(s.options, function(o) {"
+                "    return o.value + '\\u0001' + o.text;"
+                "}).join('\\u0002');",
+                name
+            )
+        except WebDriverException:
+            return None
+
+    def _wait_for_options(self, name: str, previous: Optional[str], timeout: float):
+        """Wait until a select has options other than its placeholder and previous, or the timeout passes."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: self._options_signature(name) not in (None, previous)
+            )
+        except TimeoutException:
+            self.logger.debug(f"Options for {name} did not change within {timeout}s")
+
     def _retry_click_filter_button(self, max_retries=3):
         """Retry clicking the filter button with a maximum number of retries."""
         for attempt in range(max_retries):
@@ -650,8 +993,8 @@ class AMISScraper:
     def _validate_dates(self, start_date: str, end_date: str) -> bool:
         """Validate date formats and ranges."""
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
+            start = _parse_date(start_date)
+            end = _parse_date(end_date)
             if end < start:
                 self.logger.error("End date cannot be earlier than start date")
                 return False
@@ -664,15 +1007,21 @@ class AMISScraper:
         """Click the filter button with proper error handling."""
         try:
             # Wait for the filter button to be clickable
-            filter_button = self.wait.until(
+            filter_button = self.fast_wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit']"))
             )
+            old_tables = self.driver.find_elements(*self._TABLE_CSS)
             filter_button.click()
+            self._table = None
+            self._next_button = None
             
             # Wait for results table to load or error message
             try:
-                # Wait for the table or any loading indicator to appear
-                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table")))
+                # Wait for any table from before the submit to go away, then for the new
+                # table body; a search with no results has a body but no data rows
+                if old_tables:
+                    self.wait.until(EC.staleness_of(old_tables[0]))
+                self.wait.until(self._TBODY_PRESENT)
                 self.logger.info("Results table loaded successfully")
                 return True
             except TimeoutException:
@@ -682,11 +1031,225 @@ class AMISScraper:
         except Exception as e:
             self.logger.error(f"Error clicking filter button: {str(e)}. URL: {self.driver.current_url}")
             return False
+    def _discover_search_form(self) -> Optional[Dict]:
+        """Read the search form's action, fields, option values and date field names."""
+        js_script = """
+        var select = document.querySelector("select[name='county[]']");
+        if (!select || !select.form) {
+            return null;
+        }
+        var form = select.form;
+        var fields = [];
+        new FormData(form).forEach(function(value, key) {
+            fields.push([key, value]);
+        });
+        var options = {};
+        Array.prototype.forEach.call(form.querySelectorAll('select'), function(s) {
+            var opts = {};
+            Array.prototype.forEach.call(s.options, function(o) {
+                opts[o.text.trim().toLowerCase()] = o.value;
+            });
+            options[s.name] = opts;
+        });
+        var start = document.getElementById('dateStartSearch');
+        var end = document.getElementById('dateEndSearch');
+        return {
+            action: form.action || window.location.href,
+            method: (form.getAttribute('method') || 'get').toLowerCase(),
+            fields: fields,
+            options: options,
+            dates: {start: start ? start.name : null, end: end ? end.name : null}
+        };
+        """
+        try:
+            form = self.driver.execute_script(js_script)
+        except WebDriverException as e:
+            self.logger.debug(f"Search form discovery failed: {str(e)}")
+            return None
+        if not form:
+            return None
+
+        # Keep option values learned earlier (e.g. markets loaded for another county)
+        for name, opts in form.pop('options').items():
+            self._option_cache.setdefault(name, {}).update(opts)
+        self._search_form = form
+        return form
+
+    def _build_search_payload(self, county: str, market: str, product: str,
+                              start_date: str, end_date: str,
+                              entries: str) -> Optional[List[Tuple[str, str]]]:
+        """Build the form payload for a search, or None if a value can't be resolved."""
+        form = self._search_form
+        if not form or not form['dates']['start'] or not form['dates']['end']:
+            return None
+
+        values = {
+            'county[]': county,
+            'market[]': market,
+            'product[]': product,
+            'per_page': entries
+        }
+        payload = []
+        for name, text in values.items():
+            value = self._option_cache.get(name, {}).get(text.strip().lower())
+            if value is None:
+                self.logger.debug(f"No option value known for {name}={text}")
+                return None
+            payload.append((name, value))
+        payload.append((form['dates']['start'], start_date))
+        payload.append((form['dates']['end'], end_date))
+
+        # Carry over hidden fields such as CSRF tokens
+        overridden = set(values) | {form['dates']['start'], form['dates']['end']}
+        payload.extend((k, v) for k, v in form['fields'] if k not in overridden)
+        return payload
+
+    def _ensure_search_form(self) -> bool:
+        """Discover the search form and seed the HTTP session's cookies from the browser."""
+        if self._search_form is None:
+            try:
+                self.driver.get(self.url)
+                self._wait_for_page_load()
+            except Exception as e:
+                self.logger.debug(f"Could not load search page for form discovery: {str(e)}")
+                return False
+            if not self._discover_search_form():
+                return False
+
+        # Seed the session from the browser once; it keeps its own cookies afterwards
+        if not self.session.cookies:
+            for cookie in self.driver.get_cookies():
+                self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        return True
+
+    def _prefetch_http(self, combos: List[Tuple[str, str, str]],
+                       start_date: str, end_date: str) -> Dict[Tuple[str, str, str], pd.DataFrame]:
+        """Fetch combinations over HTTP concurrently and return the ones that succeeded."""
+        # Discover the form and snapshot the browser's cookies before any worker thread
+        # starts; the workers only use the HTTP session and never touch the WebDriver
+        if not self._ensure_search_form():
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.HTTP_CONCURRENCY) as executor:
+            futures = {
+                executor.submit(self._fetch_table_http, county, market, product, start_date, end_date):
+                    (county, market, product)
+                for county, market, product in combos
+            }
+            for future in as_completed(futures):
+                try:
+                    df = future.result()
+                except Exception as e:
+                    self.logger.warning(f"HTTP fetch failed for {futures[future]}: {str(e)}")
+                    continue
+                if df is not None:
+                    results[futures[future]] = df
+        self.logger.info(f"Fetched {len(results)} of {len(combos)} combinations over HTTP")
+        return results
+
+    def _scrape_in_browser(self, county: str, market: str, product: str,
+                           start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """Scrape one combination by driving this scraper's browser through the search form."""
+        # Ask for the largest page so scrape_table rarely needs to paginate
+        if not self.set_filters(county, market, product, start_date, end_date,
+                                str(self.entry_options[-1])):
+            self.logger.warning(f"Skipping: {county}, {market}, {product} - Filter setup failed")
+            return None
+        
+        total_entries = self._get_total_entries()
+        df = self.scrape_table()
+        if total_entries:
+            self._verify_data_completeness(df, total_entries)
+        
+        # Learn the option values the browser just loaded
+        self._discover_search_form()
+        self._release_driver()
+        return df
+
+    def _scrape_parallel(self, combos: List[Tuple[str, str, str]], start_date: str, end_date: str,
+                         max_workers: int) -> Dict[Tuple[str, str, str], pd.DataFrame]:
+        """Scrape combinations on a pool of headless browsers, one scraper per worker thread."""
+        local = threading.local()
+        workers = []
+        workers_lock = threading.Lock()
+        
+        def scrape_one(county, market, product):
+            if not hasattr(local, 'scraper'):
+                local.scraper = AMISScraper(self.url, headless=True, timeout=self.timeout)
+                with workers_lock:
+                    workers.append(local.scraper)
+            return local.scraper._scrape_in_browser(county, market, product, start_date, end_date)
+        
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, self.MAX_BROWSERS)) as executor:
+                futures = {executor.submit(scrape_one, *combo): combo for combo in combos}
+                for future in as_completed(futures):
+                    try:
+                        df = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error scraping {futures[future]}: {str(e)}")
+                        continue
+                    if df is not None:
+                        results[futures[future]] = df
+        finally:
+            for worker in workers:
+                worker.quit_driver()
+        return results
+
+    def _fetch_table_http(self, county: str, market: str, product: str,
+                         start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch the results table by posting the search form directly.
+        
+        Returns None whenever the Selenium path should be used instead, e.g. when
+        an option value is not known yet or the session cookie has expired.
+        Runs on worker threads, so it expects _ensure_search_form to have run first.
+        """
+        if self._http_blocked.is_set() or self._search_form is None:
+            return None
+
+        entries = str(self.entry_options[-1])
+        payload = self._build_search_payload(county, market, product, start_date, end_date, entries)
+        if payload is None:
+            return None
+
+        form = self._search_form
+        try:
+            if form['method'] == 'post':
+                response = self.session.post(form['action'], data=payload, timeout=self.timeout)
+            else:
+                response = self.session.get(form['action'], params=payload, timeout=self.timeout)
+            if response.status_code in (403, 429) or _CHALLENGE_RE.search(response.text):
+                # Stop every HTTP worker; the browser takes over from here
+                self._http_blocked.set()
+                self.logger.warning(f"HTTP search blocked (status {response.status_code}), using the browser only")
+                return None
+            response.raise_for_status()
+        except RequestException as e:
+            self.logger.warning(f"HTTP search failed, falling back to browser: {str(e)}")
+            return None
+
+        try:
+            df = _read_results_table(response.text)
+        except ValueError:  # Table present but without parsable rows
+            df = None
+        if df is None or df.empty:
+            self.logger.info(f"No results table in HTTP response for {county}/{market}/{product}, using the browser")
+            return None
+
+        match = _ENTRIES_RE.search(response.text)
+        if match and not self._verify_data_completeness(df, int(match.group(1).replace(',', ''))):
+            self.logger.info(f"Incomplete HTTP results for {county}/{market}/{product}, using the browser")
+            return None
+
+        self.logger.info(f"Fetched {len(df)} rows over HTTP")
+        return df
+
     def scrape_table(self) -> Optional[pd.DataFrame]:
         """Scrape the data from the table and handle pagination dynamically."""
         try:
-            all_data = []  # List to hold all the scraped data
-            
             # Wait for the table to load
             self._wait_for_table_load()
 
@@ -697,26 +1260,38 @@ class AMISScraper:
             
             # Start scraping data for the first page
             page_num = 1
-            while True:
+            pages = []
+            find_element = self.driver.find_element
+            
+            # A client-side DataTable already holds every page; take them all at once
+            html = self._fetch_all_pages_html()
+            if html:
+                pages.append(_parse_table_html(html))
+            while html is None:
                 # Wait for the table on the current page to load
                 self._wait_for_table_load()
 
-                # Extract data from the table on this page
-                page_data = self._extract_table_data(page_num)
-                if page_data:
-                    all_data.append(page_data)
+                # Parse the page markup in one C-level pass
+                html = self._fetch_table_html(page_num)
+                if html:
+                    pages.append(_parse_table_html(html))
                 
                 # Check if there's a next page, and if so, go to the next one
                 if self._has_next_page():
                     page_num += 1
+                    first_row = find_element(*self._ROW_CSS)
                     self._go_to_next_page()
-                    time.sleep(2)  # Adjust delay as necessary
+                    self._wait_for_next_page(first_row)
                 else:
                     break
 
-            # If we have scraped data, convert it into a DataFrame
-            if all_data:
-                df = pd.concat(all_data, ignore_index=True)
+            pages = [page for page in pages if not page.empty]
+
+            # If we have scraped data, combine the pages; concat reconciles dtypes
+            # that were inferred differently on different pages
+            if pages:
+                df = pd.concat(pages, ignore_index=True, copy=False, sort=False)
+                self.logger.info(f"Scraped {len(df)} rows over {page_num} page(s)")
                 return df
             else:
                 self.logger.warning("No data was scraped from the table")
@@ -729,53 +1304,84 @@ class AMISScraper:
     def _wait_for_table_load(self):
         """Wait for the table to load by checking the presence of a specific element."""
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table"))  # Adjust selector if necessary
-            )
+            if self._table is None:
+                self._table = WebDriverWait(self.driver, 10).until(self._TABLE_PRESENT)
         except Exception as e:
             self.logger.error(f"Error waiting for table load: {str(e)}")
             raise
 
+    def _wait_for_next_page(self, old_row):
+        """Wait until the previous page's rows are replaced and the new rows are present."""
+        wait = WebDriverWait(self.driver, 10, poll_frequency=0.1)
+        wait.until(EC.staleness_of(old_row))
+        wait.until(self._ROW_PRESENT)
+
     def _is_data_available(self) -> bool:
         """Check if data exists in the table."""
         try:
-            table = self.driver.find_element(By.CSS_SELECTOR, "table")  # Adjust CSS selector if needed
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            return len(rows) > 1  # Data rows should be more than 1 (header row)
+            # Count the data rows in the browser, skipping DataTables' "no data" placeholder row
+            row_count = self.driver.execute_script(
+                "return Array.prototype.filter.call(arguments[0].querySelectorAll('tbody tr'),"
+                " function(row) { return !row.querySelector('td.dataTables_empty'); }).length;",
+                self._table
+            )
+            return row_count > 0
         except Exception as e:
             self.logger.error(f"Error checking for data availability: {str(e)}")
             return False
 
-    def _extract_table_data(self, page_num: int) -> pd.DataFrame:
-        """Extract data from the table on the current page."""
+    def _fetch_table_html(self, page_num: int) -> Optional[str]:
+        """Fetch the markup of the table on the current page in one round-trip."""
         try:
-            table = self.driver.find_element(By.CSS_SELECTOR, "table")  # Adjust CSS selector if needed
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            
-            # Extract headers
-            headers = [header.text for header in rows[0].find_elements(By.TAG_NAME, "th")]
-            
-            # Extract rows of data
-            data = []
-            for row in rows[1:]:  # Skip header row
-                columns = row.find_elements(By.TAG_NAME, "td")
-                row_data = [column.text for column in columns]
-                data.append(row_data)
-            
-            # Convert the extracted data into a DataFrame
-            df = pd.DataFrame(data, columns=headers)
-            self.logger.info(f"Extracted data for page {page_num}")
-            return df
+            html = self.driver.execute_script(
+                "var table = document.querySelector('table.dataTable, table');"
+                "return table ? table.outerHTML : null;"
+            )
+            if not html:
+                self.logger.warning(f"No table found on page {page_num}")
+                return None
+            self.logger.info(f"Fetched table markup for page {page_num}")
+            return html
         except Exception as e:
             self.logger.error(f"Error extracting table data: {str(e)}")
             return None
 
+    def _fetch_all_pages_html(self) -> Optional[str]:
+        """
+        Return one table holding the rows of every page, or None if pagination must be clicked.
+        
+        Only works when the table is a client-side DataTable, i.e. all rows were sent with
+        the page and DataTables merely shows them a page at a time.
+        """
+        js_script = """
+        var table = arguments[0];
+        var $ = window.jQuery;
+        if (!$ || !$.fn.dataTable || !$.fn.dataTable.isDataTable(table)) {
+            return null;
+        }
+        var api = $(table).DataTable();
+        if (api.settings()[0].oFeatures.bServerSide) {
+            return null;
+        }
+        var rows = api.rows({search: 'applied', order: 'applied'}).nodes().toArray();
+        return '<table>' + (table.tHead ? table.tHead.outerHTML : '') + '<tbody>' +
+            rows.map(function(row) { return row.outerHTML; }).join('') + '</tbody></table>';
+        """
+        try:
+            html = self.driver.execute_script(js_script, self._table)
+        except WebDriverException as e:
+            self.logger.debug(f"Could not read all DataTable pages: {str(e)}")
+            return None
+        if html:
+            self.logger.info("Fetched every page of the table in one call")
+        return html
+
     def _has_next_page(self) -> bool:
         """Check if there is a next page of results."""
         try:
             # Find the next page button (adjust selector as necessary)
-            next_button = self.driver.find_element(By.CSS_SELECTOR, ".pagination .next")
-            return "disabled" not in next_button.get_attribute("class")
+            self._next_button = self.driver.find_element(*self._NEXT_CSS)
+            return "disabled" not in self._next_button.get_attribute("class")
         except Exception as e:
             self.logger.error(f"Error checking for next page: {str(e)}")
             return False
@@ -783,66 +1389,245 @@ class AMISScraper:
     def _go_to_next_page(self):
         """Click the next page button to load the next set of results."""
         try:
-            next_button = self.driver.find_element(By.CSS_SELECTOR, ".pagination .next")
+            next_button = self._next_button or self.driver.find_element(*self._NEXT_CSS)
             next_button.click()
             self.logger.info("Navigated to next page")
         except Exception as e:
             self.logger.error(f"Error navigating to next page: {str(e)}")
+        finally:
+            # Both may be redrawn with the new page
+            self._table = None
+            self._next_button = None
 
     def quit_driver(self):
         """Properly close the driver instance."""
+        self._progress_queue.put(None)
+        self._progress_thread.join()
+        self._progress_fp.close()
         try:
             self.driver.quit()
             self.logger.info("Driver closed successfully")
         except Exception as e:
             self.logger.error(f"Error closing driver: {str(e)}")
 
-    def save_to_csv(self, df: pd.DataFrame, filename: str):
-        """Save the filtered data to a CSV file."""
+    def save(self, df: pd.DataFrame, filename: str):
+        """Save the filtered data, choosing the format from the extension (.parquet, .csv or .csv.gz)."""
         filepath = f"data/{filename}"
         if not os.path.exists("data"):
             os.makedirs("data")
-        df.to_csv(filepath, index=False)
+        if filename.endswith(".parquet"):
+            # Category columns are stored dictionary-encoded
+            df.to_parquet(filepath, engine='pyarrow', compression='snappy', index=False)
+        elif filename.endswith(".csv.gz"):
+            df.to_csv(filepath, index=False, compression='gzip')
+        else:
+            df.to_csv(filepath, index=False)
         print(f"Data saved to {filepath}")
 
-    def scrape_by_month(self, start_date: str, end_date: str, county: str, market: str, product: str, output_file: str = "scraped_data.csv") -> pd.DataFrame:
-        """Scrape data month by month within a given date range and save to CSV."""
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+    save_to_csv = save  # Old name, kept for existing callers
+
+    def scrape_by_month(self, start_date: str, end_date: str, county: str, market: str, product: str, output_file: str = "scraped_data.parquet") -> pd.DataFrame:
+        """Scrape data month by month within a given date range and save it to output_file."""
+        # Every month start in the range (plus start_date itself), paired with that month's last day
+        month_starts = pd.date_range(start_date, end_date, freq='MS').union([pd.Timestamp(start_date)])
+        month_ends = month_starts + pd.offsets.MonthEnd(0)
         all_monthly_data = []
 
-        while start <= end:
-            # Adjust the filter for the specific month
-            month_start_date = start.strftime("%Y-%m-%d")
-            month_end_date = (start + relativedelta(day=31)).strftime("%Y-%m-%d")
-            
+        for month_start_date, month_end_date in zip(month_starts.strftime("%Y-%m-%d"),
+                                                    month_ends.strftime("%Y-%m-%d")):
             # Set the filters for the current month
             if not self.set_filters(county, market, product, month_start_date, month_end_date):
                 print(f"Skipping month {month_start_date} due to filter issues")
-                start += relativedelta(months=1)
                 continue
 
             # Scrape the table for this month
             df = self.scrape_table()
             if df is not None:
                 all_monthly_data.append(df)
-            
-            # Move to the next month
-            start += relativedelta(months=1)
 
         # Combine all monthly data
         if all_monthly_data:
-            final_df = pd.concat(all_monthly_data, ignore_index=True)
-            # Save the DataFrame to a CSV file
-            self.save_to_csv(final_df, output_file)
+            final_df = _apply_column_types(pd.concat(all_monthly_data, ignore_index=True, copy=False))
+            # Save the DataFrame in the format given by its extension
+            self.save(final_df, output_file)
             return final_df
         else:
             print("No data collected for the given date range")
             return None
+
+    def run_all(
+        self, 
+        counties: List[str], 
+        products: List[str], 
+        markets: List[str], 
+        start_date: str, 
+        end_date: str, 
+        resume: bool = False,
+        max_workers: int = 1
+    ) -> Optional[pd.DataFrame]:
+        """
+        Systematically scrape data across multiple configurations with progress tracking.
+        
+        Args:
+            counties (List[str]): List of counties to scrape
+            products (List[str]): List of products to scrape
+            markets (List[str]): List of markets to scrape
+            start_date (str): Start date for data collection
+            end_date (str): End date for data collection
+            resume (bool): Whether to resume from last saved progress
+            max_workers (int): Headless browsers to scrape with in parallel (capped at MAX_BROWSERS)
+        
+        Returns:
+            Optional[pd.DataFrame]: Consolidated DataFrame of scraped data; use
+            run_all_to_parquet to keep large runs out of memory
+        """
+        parquet_path = self.run_all_to_parquet(counties, products, markets, start_date, end_date,
+                                               resume=resume, max_workers=max_workers)
+        if parquet_path is None:
+            return None
+        return _apply_column_types(pd.read_parquet(parquet_path))
+
+    def run_all_to_parquet(
+        self, 
+        counties: List[str], 
+        products: List[str], 
+        markets: List[str], 
+        start_date: str, 
+        end_date: str, 
+        resume: bool = False,
+        max_workers: int = 1
+    ) -> Optional[str]:
+        """
+        Scrape like run_all, but leave the results on disk instead of returning them.
+        
+        Each scraped combination is written to its own Parquet part as soon as it arrives,
+        so memory use does not grow with the size of the run. The parts are then merged,
+        one at a time, into a single Parquet file and a CSV file under a schema that
+        covers every part.
+        
+        Returns:
+            Optional[str]: Path of the Parquet file holding all scraped data
+        """
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        parts_dir = os.path.join(self.dirs['exports'], f"parts_{stamp}")
+        part_files = []
+        merged = False
+        try:
+            # If resuming, load the last saved progress
+            if resume and self.progress['last_county']:
+                start_index = {
+                    'counties': counties.index(self.progress['last_county']) if self.progress['last_county'] in counties else 0,
+                    'markets': markets.index(self.progress['last_market']) if self.progress['last_market'] in markets else 0,
+                    'products': products.index(self.progress['last_product']) if self.progress['last_product'] in products else 0
+                }
+            else:
+                start_index = {'counties': 0, 'markets': 0, 'products': 0}
+            
+            # Flatten the loops, starting from the saved position when resuming
+            combos = []
+            for county_idx in range(start_index['counties'], len(counties)):
+                for market_idx in range(start_index['markets'], len(markets)):
+                    for product_idx in range(start_index['products'], len(products)):
+                        combos.append((counties[county_idx], markets[market_idx], products[product_idx]))
+                    start_index['products'] = 0
+                start_index['markets'] = 0
+            
+            # Recent scrapes of the same combination and dates are reused as they are
+            cached = {}
+            for combo in combos:
+                df = self._load_cached(*combo, start_date, end_date)
+                if df is not None:
+                    cached[combo] = df
+            if cached:
+                self.logger.info(f"Reusing {len(cached)} of {len(combos)} combinations from the cache")
+            to_fetch = [combo for combo in combos if combo not in cached]
+            
+            # Post every search form concurrently; the browser only handles what's left
+            prefetched = self._prefetch_http(to_fetch, start_date, end_date)
+            
+            if max_workers > 1:
+                remaining = [combo for combo in to_fetch if combo not in prefetched]
+                prefetched.update(self._scrape_parallel(remaining, start_date, end_date, max_workers))
+            
+            os.makedirs(parts_dir, exist_ok=True)
+            for county, market, product in combos:
+                self.logger.info(f"Scraping: {county}, {market}, {product}")
+                
+                # Apply error handling and retry logic
+                try:
+                    df = cached.pop((county, market, product), None)
+                    from_cache = df is not None
+                    if df is None:
+                        df = prefetched.pop((county, market, product), None)
+                    
+                    # Parallel runs have already tried every combination in a browser
+                    if df is None and max_workers <= 1:
+                        df = self._scrape_in_browser(county, market, product, start_date, end_date)
+                    
+                    if df is None or df.empty:
+                        self.logger.warning(f"No data collected for {county}, {market}, {product}")
+                        continue
+                    
+                    if not from_cache:
+                        self._store_cached(df, county, market, product, start_date, end_date)
+                    df = _apply_column_types(_tag_frame(df, county, market, product))
+                    part_path = os.path.join(parts_dir, f"part-{len(part_files):05d}.parquet")
+                    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), part_path)
+                    part_files.append(part_path)
+                    
+                    # Save progress only once the rows are on disk
+                    self._save_progress(county, market, product)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error scraping {county}, {market}, {product}, "
+                                      f"its rows were not saved: {str(e)}")
+                    continue
+            
+            if not part_files:
+                self.logger.warning("No data collected across all configurations")
+                return None
+            
+            parquet_path = os.path.join(self.dirs['exports'], f"amis_scrape_{stamp}.parquet")
+            csv_path = f"data/amis_scrape_{stamp}.csv"
+            os.makedirs("data", exist_ok=True)
+            rows_written = self._merge_parts(part_files, parquet_path, csv_path)
+            merged = True
+            self.logger.info(f"Saved {rows_written} rows to {parquet_path} and {csv_path}")
+            return parquet_path
+        
+        except Exception as e:
+            self.logger.critical(f"Critical error in run_all: {str(e)}", exc_info=True)
+            if part_files:
+                self.logger.critical(f"Scraped parts were kept in {parts_dir}")
+            return None
         
+        finally:
+            # Parts are kept if the merge failed, so the scraped rows can still be recovered
+            if merged or not part_files:
+                shutil.rmtree(parts_dir, ignore_errors=True)
+
+    def _merge_parts(self, part_files: List[str], parquet_path: str, csv_path: str) -> int:
+        """Append Parquet parts to one Parquet file and one CSV file, one part in memory at a time."""
+        schema = _merge_schemas([pq.read_schema(path).remove_metadata() for path in part_files])
+        rows_written = 0
+        with pq.ParquetWriter(parquet_path, schema) as writer, \
+                pacsv.CSVWriter(csv_path, schema) as csv_writer:
+            for path in part_files:
+                part = pq.read_table(path)
+                # Missing columns are filled with nulls rather than dropping the part
+                table = pa.table([
+                    part[field.name].cast(field.type) if field.name in part.column_names
+                    else pa.nulls(len(part), field.type)
+                    for field in schema
+                ], schema=schema)
+                writer.write_table(table)
+                csv_writer.write_table(table)
+                rows_written += len(table)
+        return rows_written
+
 def network_retry(max_attempts=3, delay=5):
     """
-    Decorator for handling network-related errors with exponential backoff.
+    Decorator for handling network and WebDriver errors with exponential backoff and jitter.
     
     Args:
         max_attempts (int): Maximum number of retry attempts
@@ -862,117 +1647,26 @@ def network_retry(max_attempts=3, delay=5):
                     MaxRetryError, 
                     NewConnectionError, 
                     Timeout,
-                    TimeoutError
+                    TimeoutError,
+                    WebDriverException
                 ) as e:
                     attempts += 1
                     if attempts == max_attempts:
                         raise  # Re-raise the last exception if all attempts fail
                     
-                    logger = args[0].logger if args else None
+                    # Exponential backoff, with jitter so parallel workers don't retry in step
+                    wait_time = delay * (2 ** (attempts - 1)) + random.uniform(0, delay)
+                    logger = getattr(args[0], 'logger', None) if args else None
                     if logger:
                         logger.warning(
                             f"Network error on attempt {attempts}: {str(e)}. "
-                            f"Retrying in {delay * attempts} seconds..."
+                            f"Retrying in {wait_time:.1f} seconds..."
                         )
                     
-                    time.sleep(delay * attempts)  # Exponential backoff
+                    time.sleep(wait_time)
         return wrapper
     return decorator
 
-def run_all(
-    self, 
-    counties: List[str], 
-    products: List[str], 
-    markets: List[str], 
-    start_date: str, 
-    end_date: str, 
-    resume: bool = False
-) -> Optional[pd.DataFrame]:
-    """
-    Systematically scrape data across multiple configurations with progress tracking.
-    
-    Args:
-        counties (List[str]): List of counties to scrape
-        products (List[str]): List of products to scrape
-        markets (List[str]): List of markets to scrape
-        start_date (str): Start date for data collection
-        end_date (str): End date for data collection
-        resume (bool): Whether to resume from last saved progress
-    
-    Returns:
-        Optional[pd.DataFrame]: Consolidated DataFrame of scraped data
-    """
-    try:
-        # If resuming, load the last saved progress
-        if resume and self.progress['last_county']:
-            start_index = {
-                'counties': counties.index(self.progress['last_county']) if self.progress['last_county'] in counties else 0,
-                'markets': markets.index(self.progress['last_market']) if self.progress['last_market'] in markets else 0,
-                'products': products.index(self.progress['last_product']) if self.progress['last_product'] in products else 0
-            }
-        else:
-            start_index = {'counties': 0, 'markets': 0, 'products': 0}
-        
-        all_data = []
-        
-        # Nested loops for comprehensive scraping
-        for county_idx in range(start_index['counties'], len(counties)):
-            county = counties[county_idx]
-            
-            for market_idx in range(start_index['markets'], len(markets)):
-                market = markets[market_idx]
-                
-                for product_idx in range(start_index['products'], len(products)):
-                    product = products[product_idx]
-                    
-                    self.logger.info(f"Scraping: {county}, {market}, {product}")
-                    
-                    # Apply error handling and retry logic
-                    try:
-                        # Set filters and scrape
-                        if not self.set_filters(county, market, product, start_date, end_date):
-                            self.logger.warning(f"Skipping: {county}, {market}, {product} - Filter setup failed")
-                            continue
-                        
-                        df = self.scrape_table()
-                        
-                        if df is not None and not df.empty:
-                            df['County'] = county
-                            df['Market'] = market
-                            df['Product'] = product
-                            all_data.append(df)
-                            
-                            # Save progress after successful scrape
-                            self._save_progress(county, market, product)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error scraping {county}, {market}, {product}: {str(e)}")
-                        continue
-                    
-                    # Reset product loop index after complete processing
-                    start_index['products'] = 0
-                
-                # Reset market loop index after complete processing
-                start_index['markets'] = 0
-            
-            # Reset county loop index after complete processing
-            start_index['counties'] = 0
-        
-        # Consolidate all scraped data
-        if all_data:
-            final_df = pd.concat(all_data, ignore_index=True)
-            self.save_to_csv(final_df, f"amis_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-            return final_df
-        
-        self.logger.warning("No data collected across all configurations")
-        return None
-    
-    except Exception as e:
-        self.logger.critical(f"Critical error in run_all: {str(e)}", exc_info=True)
-        return None
-
-# Add the method to the class
-AMISScraper.run_all = run_all
 
 # Main function to run the scraper
 def main():
@@ -1036,11 +1730,8 @@ def main():
         scraper.logger.critical(f"Critical error in main process: {str(e)}", exc_info=True)
     
     finally:
-        try:
-            scraper.driver.quit()
-            scraper.logger.info("Browser closed successfully")
-        except Exception as e:
-            scraper.logger.error(f"Error closing browser: {str(e)}")
+        # Also writes out any progress entries still queued
+        scraper.quit_driver()
 
 # Ensure main() is called only when the script is run directly
 if __name__ == "__main__":